@@ -1,5 +1,6 @@
 from ..validation import ConfigModel
-import json
+import functools
+import orjson
 import os
 import logging
 
@@ -27,7 +28,7 @@ def config_machine(args):
         )
 
         # Save the configuration to file
-        create_local_config(str(config.app_url), config.api_key)
+        create_local_config(config.app_url, config.api_key)
 
         print(f"✓ Configuration saved successfully to {CONFIG_PATH}")
 
@@ -40,6 +41,8 @@ def get_local_config() -> ConfigModel:
     """
     Retrieves the local configuration from the config file.
 
+    The parsed config is cached until the file's modification time changes.
+
     Returns:
         ConfigModel: The validated configuration
 
@@ -47,9 +50,7 @@ def get_local_config() -> ConfigModel:
         Exception: If config file is not found
     """
     try:
-        with open(CONFIG_PATH, "r") as f:
-            local_config = json.load(f)
-            return ConfigModel(**local_config)
+        return _load_local_config(os.path.getmtime(CONFIG_PATH))
     except FileNotFoundError:
         logger.error("Config file not found")
         raise Exception(
@@ -60,6 +61,29 @@ def get_local_config() -> ConfigModel:
         raise Exception(f"Failed to load configuration: {e}")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_local_config(mtime: float) -> ConfigModel:
+    """
+    Reads and validates the config file.
+
+    Args:
+        mtime: Modification time of the config file, used only as the cache key
+
+    Returns:
+        ConfigModel: The validated configuration
+    """
+    with open(CONFIG_PATH, "rb") as f:
+        local_config = orjson.loads(f.read())
+        return ConfigModel(**local_config)
+
+
+def clear_config_cache() -> None:
+    """
+    Drops the cached config so the next get_local_config call re-reads the file.
+    """
+    _load_local_config.cache_clear()
+
+
 def create_local_config(api_url: str, api_key: str) -> dict:
     """
     Creates and saves the local configuration file with secure permissions.
@@ -82,8 +106,11 @@ def create_local_config(api_url: str, api_key: str) -> dict:
 
         # Create config file with secure permissions (owner read/write only)
         fd = os.open(CONFIG_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        with os.fdopen(fd, "w") as f:
-            json.dump(config, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+
+        # The mtime may not change within the filesystem's timestamp resolution
+        clear_config_cache()
 
         return config
 
@@ -1,103 +1,355 @@
-from cli.database import database
+from cli.database import get_database, SCHEMA_VERSION, STORE_USER_COUNT_SQL, USER_INDEXES
+import functools
 import logging
 import sqlite3
 import math
-from typing import Optional, Union
+from typing import Iterator, NamedTuple, Optional, Union
 from ..validation import OktaUserResponse
 
 logger = logging.getLogger(__name__)
 
+# Column order must match the unpacking in UsersRepository._row_to_dict
+USER_COLUMNS = """
+    id, status, created, activated, statusChanged,
+    lastLogin, lastUpdated, passwordChanged, type_id,
+    reportGroupList, firstName, lastName, mobilePhone,
+    portalAccessGroup, secondEmail, ackNewBusiness, login, email, placementOrg
+"""
+
+SELECT_USERS_SQL = f"SELECT {USER_COLUMNS} FROM users"
+
+# Page order for get_all_users_paginated, served by idx_users_page_order.
+# A NULL lastUpdated sorts as '' so the row-value comparison never sees a NULL
+# and those rows stay reachable from a cursor.
+USERS_PAGE_KEY_SQL = "COALESCE(lastUpdated, '')"
+USERS_PAGE_ORDER_SQL = f" ORDER BY {USERS_PAGE_KEY_SQL} DESC, id DESC LIMIT ?"
+USERS_PAGE_SQL = SELECT_USERS_SQL + USERS_PAGE_ORDER_SQL + " OFFSET ?"
+# A keyset cursor is the (lastUpdated, id) of the last row on the previous page.
+# The leading single-column bound is what lets SQLite seek the expression index
+# instead of scanning it; the row value then settles ties on id.
+USERS_PAGE_AFTER_SQL = (
+    SELECT_USERS_SQL
+    + f" WHERE {USERS_PAGE_KEY_SQL} <= ? AND ({USERS_PAGE_KEY_SQL}, id) < (?, ?)"
+    + USERS_PAGE_ORDER_SQL
+)
+
+# The total is cached in the metadata table (see STORE_USER_COUNT_SQL) and refreshed
+# by every write, so reading a page never writes. A sync refreshes it once at the end.
+SELECT_USER_COUNT_SQL = "SELECT value FROM metadata WHERE key = 'user_count'"
+COUNT_USERS_SQL = "SELECT count(*) FROM users"
+
+# Upsert in place (INSERT OR REPLACE would delete and re-insert the row)
+UPSERT_USER_SQL = f"""
+    INSERT INTO users ({USER_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        status = excluded.status,
+        created = excluded.created,
+        activated = excluded.activated,
+        statusChanged = excluded.statusChanged,
+        lastLogin = excluded.lastLogin,
+        lastUpdated = excluded.lastUpdated,
+        passwordChanged = excluded.passwordChanged,
+        type_id = excluded.type_id,
+        reportGroupList = excluded.reportGroupList,
+        firstName = excluded.firstName,
+        lastName = excluded.lastName,
+        mobilePhone = excluded.mobilePhone,
+        portalAccessGroup = excluded.portalAccessGroup,
+        secondEmail = excluded.secondEmail,
+        ackNewBusiness = excluded.ackNewBusiness,
+        login = excluded.login,
+        email = excluded.email,
+        placementOrg = excluded.placementOrg
+"""
+
+# RETURNING (SQLite 3.35+) hands back the written row without a follow-up SELECT.
+# The column lists follow SELECT_USERS_SQL so the rows can go through _row_to_dict.
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+USER_RETURNING_SQL = f" RETURNING {USER_COLUMNS}"
+
+PROFILE_RETURNING_SQL = """
+    RETURNING reportGroupList, firstName, lastName, mobilePhone,
+        portalAccessGroup, secondEmail, ackNewBusiness, login, email, placementOrg
+"""
+
+# Profile columns that update_user_profile may change, in UPDATE_USER_PROFILE_SQL order
+PROFILE_UPDATE_FIELDS = (
+    "reportGroupList",
+    "firstName",
+    "lastName",
+    "mobilePhone",
+    "portalAccessGroup",
+    "secondEmail",
+    "ackNewBusiness",
+    "login",
+    "email",
+    "placementOrg",
+)
+
+# A NULL parameter keeps the current value, so one statement covers any subset of fields
+UPDATE_USER_PROFILE_SQL = (
+    "UPDATE users SET "
+    + ", ".join(f"{field} = COALESCE(?, {field})" for field in PROFILE_UPDATE_FIELDS)
+    + " WHERE id = ?"
+)
+
+
+class UserRow(NamedTuple):
+    """
+    A user as stored in the users table, fields in SELECT_USERS_SQL column order.
+
+    Bulk reads return these instead of nested dicts: attribute access needs no
+    hash lookups and no per-row profile dict is built.
+    """
+
+    id: str
+    status: Optional[str]
+    created: Optional[str]
+    activated: Optional[str]
+    status_changed: Optional[str]
+    last_login: Optional[str]
+    last_updated: Optional[str]
+    password_changed: Optional[str]
+    type_id: Optional[str]
+    report_group_list: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    mobile_phone: Optional[str]
+    portal_access_group: Optional[str]
+    second_email: Optional[str]
+    ack_new_business: Optional[int]
+    login: Optional[str]
+    email: Optional[str]
+    placement_org: Optional[str]
+
+    def to_api_dict(self) -> dict:
+        """
+        Converts the row to the nested dict shape of an Okta API response.
+
+        Returns:
+            dict: User data formatted like Okta API response
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "activated": self.activated,
+            "statusChanged": self.status_changed,
+            "lastLogin": self.last_login,
+            "lastUpdated": self.last_updated,
+            "passwordChanged": self.password_changed,
+            "type": {"id": self.type_id} if self.type_id else None,
+            "profile": UsersRepository._profile_row_to_dict(self[9:]),
+        }
+
 
 class UsersRepository:
     """
     Repository for managing user data in the local SQLite database.
 
-    Handles all CRUD operations for users and user profiles.
+    Handles all CRUD operations for users and their profiles.
     """
 
     def __init__(self) -> None:
+        database = get_database()
         self.connection = database.get_db_connection()
-
-    def create_or_update_user(self, user: Union[dict, OktaUserResponse]) -> None:
+        # The connection is shared across threads, hold the lock around each statement + commit
+        self._lock = database.get_db_lock()
+        # One cursor reused by every method instead of creating one per call
+        self._cursor = self.connection.cursor()
+        # Set between begin_bulk_load and end_bulk_load, which refreshes the user count once
+        self._bulk_loading = False
+
+    def create_or_update_user(self, user: Union[dict, OktaUserResponse]) -> Optional[dict]:
         """
         Creates a new user or updates an existing one.
 
         Args:
             user: User data dictionary or OktaUserResponse from Okta API
 
+        Returns:
+            dict | None: The stored user formatted like Okta API response
+
         Raises:
             sqlite3.Error: If database operation fails
         """
-        # Convert Pydantic model to dict if necessary
-        if isinstance(user, OktaUserResponse):
-            user = user.model_dump()
-        try:
-            cursor = self.connection.cursor()
-
-            # Extract user type
-            user_type = user.get("type", {})
-            if user_type and "id" in user_type:
-                cursor.execute(
-                    "INSERT OR REPLACE INTO user_types (id) VALUES (?)",
-                    (user_type["id"],),
-                )
-
-            # Insert or replace user
-            # Extract profile for placementOrg (it's in profile, not _embedded)
-            profile = user.get("profile", {})
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO users (
-                    id, status, created, activated, statusChanged,
-                    lastLogin, lastUpdated, passwordChanged, placementOrg, type_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    user.get("id"),
-                    user.get("status"),
-                    user.get("created"),
-                    user.get("activated"),
-                    user.get("statusChanged"),
-                    user.get("lastLogin"),
-                    user.get("lastUpdated"),
-                    user.get("passwordChanged"),
-                    profile.get("placementOrg"),
-                    user_type.get("id") if user_type else None,
-                ),
-            )
+        user_row = self._extract_user_row(user)
+        with self._lock:
+            try:
+                cursor = self._cursor
+
+                if SUPPORTS_RETURNING:
+                    cursor.execute(UPSERT_USER_SQL + USER_RETURNING_SQL, user_row)
+                    stored_user = cursor.fetchone()
+                else:
+                    cursor.execute(UPSERT_USER_SQL, user_row)
+                # The per-user retries of a failed sync batch leave it to end_bulk_load
+                if not self._bulk_loading:
+                    cursor.execute(STORE_USER_COUNT_SQL)
+
+                self.connection.commit()
+                logger.debug(f"Upserted user: {user_row[0]}")
+
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error creating/updating user: {e}")
+                raise
+
+        if not SUPPORTS_RETURNING:
+            return self.get_user_by_id(user_row[0])
+        return self._row_to_dict(stored_user)
+
+    def bulk_upsert_users(self, users: list[Union[dict, OktaUserResponse]]) -> int:
+        """
+        Creates or updates many users in a single transaction.
 
-            # Insert or replace user profile (profile already extracted above)
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO user_profiles (
-                    user_id, reportGroupList, firstName, lastName,
-                    mobilePhone, portalAccessGroup, secondEmail,
-                    ackNewBusiness, login, email, placementOrg
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    user.get("id"),
-                    profile.get("reportGroupList"),
-                    profile.get("firstName"),
-                    profile.get("lastName"),
-                    profile.get("mobilePhone"),
-                    profile.get("portalAccessGroup"),
-                    profile.get("secondEmail"),
-                    profile.get("ackNewBusiness"),
-                    profile.get("login"),
-                    profile.get("email"),
-                    profile.get("placementOrg"),
-                ),
-            )
+        Rows are built in one pass and written with a single executemany,
+        so the whole batch costs one commit instead of one per user.
 
-            self.connection.commit()
-            logger.debug(f"Upserted user: {user.get('id')}")
+        Args:
+            users: List of user data dictionaries or OktaUserResponse models from Okta API
 
-        except sqlite3.Error as e:
-            self.connection.rollback()
-            logger.error(f"Error creating/updating user: {e}")
-            raise
+        Returns:
+            int: Number of users written
+
+        Raises:
+            sqlite3.Error: If database operation fails, the whole batch is rolled back
+        """
+        user_rows = [self._extract_user_row(user) for user in users]
+
+        if not user_rows:
+            return 0
+
+        with self._lock:
+            try:
+                # The connection shortcut builds its cursor in C, nothing is fetched back here
+                self.connection.executemany(UPSERT_USER_SQL, user_rows)
+                if not self._bulk_loading:
+                    self.connection.execute(STORE_USER_COUNT_SQL)
+
+                self.connection.commit()
+                logger.debug(f"Upserted {len(user_rows)} users")
+                return len(user_rows)
+
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error bulk upserting users: {e}")
+                raise
+
+    def begin_bulk_load(self) -> None:
+        """
+        Drops the secondary indexes ahead of a full sync.
+
+        Rebuilding an index once after the load is cheaper than updating it for
+        every inserted row. Must be paired with end_bulk_load.
+
+        Raises:
+            sqlite3.Error: If an index cannot be dropped
+        """
+        with self._lock:
+            try:
+                cursor = self._cursor
+                for index_name in USER_INDEXES:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                # If the process dies mid-load, the next start re-runs schema init and restores the indexes
+                cursor.execute("PRAGMA user_version = 0")
+                self.connection.commit()
+                self._bulk_loading = True
+                logger.debug("Dropped user indexes for bulk load")
+
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error preparing bulk load: {e}")
+                raise
+
+    def end_bulk_load(self) -> None:
+        """
+        Recreates the secondary indexes dropped by begin_bulk_load.
+
+        Raises:
+            sqlite3.Error: If an index cannot be created
+        """
+        with self._lock:
+            try:
+                cursor = self._cursor
+                for index_sql in USER_INDEXES.values():
+                    cursor.execute(index_sql)
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                cursor.execute(STORE_USER_COUNT_SQL)
+                self.connection.commit()
+                self._bulk_loading = False
+                logger.debug("Recreated user indexes after bulk load")
+
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error finishing bulk load: {e}")
+                raise
+
+    @staticmethod
+    def _extract_user_row(user: Union[dict, OktaUserResponse]) -> tuple:
+        """
+        Builds the parameter tuple for the users upsert.
+
+        Validated models are read through attribute access rather than model_dump(),
+        which would serialize the whole model tree just to read a few fields back.
+
+        Args:
+            user: User data dictionary or OktaUserResponse from Okta API
+
+        Returns:
+            tuple: users row in SELECT_USERS_SQL column order
+        """
+        if isinstance(user, OktaUserResponse):
+            profile = user.profile
+            return (
+                user.id,
+                user.status,
+                user.created,
+                user.activated,
+                user.statusChanged,
+                user.lastLogin,
+                user.lastUpdated,
+                user.passwordChanged,
+                user.type.id,
+                profile.reportGroupList,
+                profile.firstName,
+                profile.lastName,
+                profile.mobilePhone,
+                profile.portalAccessGroup,
+                profile.secondEmail,
+                profile.ackNewBusiness,
+                profile.login,
+                profile.email,
+                profile.placementOrg,
+            )
+
+        user_type = user.get("type") or {}
+        # placementOrg lives in profile, not _embedded
+        profile = user.get("profile") or {}
+
+        return (
+            user.get("id"),
+            user.get("status"),
+            user.get("created"),
+            user.get("activated"),
+            user.get("statusChanged"),
+            user.get("lastLogin"),
+            user.get("lastUpdated"),
+            user.get("passwordChanged"),
+            user_type.get("id"),
+            profile.get("reportGroupList"),
+            profile.get("firstName"),
+            profile.get("lastName"),
+            profile.get("mobilePhone"),
+            profile.get("portalAccessGroup"),
+            profile.get("secondEmail"),
+            profile.get("ackNewBusiness"),
+            profile.get("login"),
+            profile.get("email"),
+            profile.get("placementOrg"),
+        )
 
     def get_user_by_id(self, user_id: str) -> Optional[dict]:
         """
@@ -109,30 +361,19 @@ class UsersRepository:
         Returns:
             dict | None: User data with profile formatted like Okta API response, or None if not found
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    u.id, u.status, u.created, u.activated, u.statusChanged,
-                    u.lastLogin, u.lastUpdated, u.passwordChanged, u.type_id,
-                    p.reportGroupList, p.firstName, p.lastName, p.mobilePhone,
-                    p.portalAccessGroup, p.secondEmail, p.ackNewBusiness, p.login, p.email, p.placementOrg
-                FROM users u
-                LEFT JOIN user_profiles p ON u.id = p.user_id
-                WHERE u.id = ?
-                """,
-                (user_id,),
-            )
+        with self._lock:
+            try:
+                cursor = self._cursor
+                cursor.execute(SELECT_USERS_SQL + " WHERE id = ?", (user_id,))
 
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_dict(row)
-            return None
+                row = cursor.fetchone()
+                if row:
+                    return self._row_to_dict(row)
+                return None
 
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving user by ID: {e}")
-            raise
+            except sqlite3.Error as e:
+                logger.error(f"Error retrieving user by ID: {e}")
+                raise
 
     def get_user_by_email(self, email: str) -> Optional[dict]:
         """
@@ -144,175 +385,187 @@ class UsersRepository:
         Returns:
             dict | None: User data with profile formatted like Okta API response, or None if not found
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    u.id, u.status, u.created, u.activated, u.statusChanged,
-                    u.lastLogin, u.lastUpdated, u.passwordChanged, u.type_id,
-                    p.reportGroupList, p.firstName, p.lastName, p.mobilePhone,
-                    p.portalAccessGroup, p.secondEmail, p.ackNewBusiness, p.login, p.email, p.placementOrg
-                FROM users u
-                LEFT JOIN user_profiles p ON u.id = p.user_id
-                WHERE p.email = ?
-                """,
-                (email,),
-            )
+        with self._lock:
+            try:
+                cursor = self._cursor
+                cursor.execute(SELECT_USERS_SQL + " WHERE email = ?", (email,))
 
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_dict(row)
-            return None
+                row = cursor.fetchone()
+                if row:
+                    return self._row_to_dict(row)
+                return None
 
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving user by email: {e}")
-            raise
+            except sqlite3.Error as e:
+                logger.error(f"Error retrieving user by email: {e}")
+                raise
 
-    def get_all_users(self) -> list[dict]:
+    def get_all_users(self) -> list[UserRow]:
         """
         Retrieves all users from the database.
 
         Returns:
-            list[dict]: List of user dictionaries formatted like Okta API responses
+            list[UserRow]: All users, use UserRow.to_api_dict for the Okta API shape
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    u.id, u.status, u.created, u.activated, u.statusChanged,
-                    u.lastLogin, u.lastUpdated, u.passwordChanged, u.type_id,
-                    p.reportGroupList, p.firstName, p.lastName, p.mobilePhone,
-                    p.portalAccessGroup, p.secondEmail, p.ackNewBusiness, p.login, p.email, p.placementOrg
-                FROM users u
-                LEFT JOIN user_profiles p ON u.id = p.user_id
-                """
-            )
+        with self._lock:
+            try:
+                cursor = self._cursor
+                cursor.execute(SELECT_USERS_SQL)
+
+                rows = cursor.fetchall()
+                return [UserRow._make(row) for row in rows]
+
+            except sqlite3.Error as e:
+                logger.error(f"Error retrieving all users: {e}")
+                raise
+
+    def iter_all_users(self, chunk_size: int = 1000) -> Iterator[UserRow]:
+        """
+        Streams all users from the database, chunk_size rows at a time.
 
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        Only one chunk is held in memory, so callers such as the CSV export
+        can start writing before the whole table has been read.
+
+        Args:
+            chunk_size: Number of rows fetched per round trip
+
+        Yields:
+            UserRow: Users, use UserRow.to_api_dict for the Okta API shape
+        """
+        # Own cursor, so other repository calls made while iterating don't reset it.
+        # Plain tuples from the cursor go straight into UserRow, skipping sqlite3.Row.
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        try:
+            with self._lock:
+                cursor.execute(SELECT_USERS_SQL)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from map(UserRow._make, rows)
 
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving all users: {e}")
+            logger.error(f"Error streaming all users: {e}")
             raise
 
-    def get_all_users_paginated(self, limit: int = 25, page: int = 1) -> dict:
+        finally:
+            cursor.close()
+
+    def get_all_users_paginated(
+        self, limit: int = 25, page: int = 1, cursor: Optional[tuple[str, str]] = None
+    ) -> dict:
         """
-        Retrieves users from the database with pagination.
+        Retrieves users from the database with pagination, most recently updated first.
+
+        With a cursor the page is read with an index range scan (keyset pagination),
+        so it costs the same at any depth. Without one, page is used as an OFFSET.
 
         Args:
             limit: Number of users per page (default: 25)
-            page: Page number, starting from 1 (default: 1)
+            page: Page number, starting from 1 (default: 1), ignored when cursor is given
+            cursor: (lastUpdated, id) of the last user on the previous page
 
         Returns:
             dict: Dictionary containing:
                 - total_users: Total number of users in database
                 - total_pages: Total number of pages
-                - current_page: Current page number
-                - users: List of user dictionaries for the current page
+                - current_page: Current page number, None when reading from a cursor
+                - users: List of UserRow for the current page
+                - next_cursor: Cursor for the following page, None on the last page
         """
         output_dict = {
             "total_users": 0,
             "total_pages": 0,
-            "current_page": page,
-            "users": []
+            "current_page": None if cursor else page,
+            "users": [],
+            "next_cursor": None,
         }
 
-        try:
-            cursor = self.connection.cursor()
-
-            # Get total count
-            count_query = """
-            SELECT count(u.id) AS total_users
-            FROM users u
-            LEFT JOIN user_profiles p ON u.id = p.user_id
-            """
-            cursor.execute(count_query)
-            count_row = cursor.fetchone()
-            total = count_row[0] if count_row else 0
-
-            # Calculate pagination
-            output_dict["total_users"] = total
-            output_dict["total_pages"] = math.ceil(total / limit) if total > 0 else 0
-
-            # Get paginated users
-            offset = limit * (page - 1)
-            select_query = """
-            SELECT
-                u.id, u.status, u.created, u.activated, u.statusChanged,
-                u.lastLogin, u.lastUpdated, u.passwordChanged, u.type_id,
-                p.reportGroupList, p.firstName, p.lastName, p.mobilePhone,
-                p.portalAccessGroup, p.secondEmail, p.ackNewBusiness, p.login, p.email, p.placementOrg
-            FROM users u
-            LEFT JOIN user_profiles p ON u.id = p.user_id
-            LIMIT ? OFFSET ?
-            """
-
-            cursor.execute(select_query, (limit, offset))
-            rows = cursor.fetchall()
-
-            # Convert rows to dict format
-            output_dict["users"] = [self._row_to_dict(row) for row in rows]
-
-            return output_dict
-
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving users paginated: {e}")
-            raise
-
-    def update_user_profile(self, user_id: str, profile: dict) -> None:
+        with self._lock:
+            try:
+                db_cursor = self._cursor
+
+                # Get total count, counting the table only when the cache was never stored
+                db_cursor.execute(SELECT_USER_COUNT_SQL)
+                count_row = db_cursor.fetchone()
+                if count_row is None:
+                    db_cursor.execute(COUNT_USERS_SQL)
+                    count_row = db_cursor.fetchone()
+                total = int(count_row[0])
+
+                # Calculate pagination
+                output_dict["total_users"] = total
+                output_dict["total_pages"] = math.ceil(total / limit) if total > 0 else 0
+
+                # Get paginated users
+                if cursor:
+                    last_updated, user_id = cursor
+                    db_cursor.execute(
+                        USERS_PAGE_AFTER_SQL, (last_updated, last_updated, user_id, limit)
+                    )
+                else:
+                    offset = limit * (page - 1)
+                    db_cursor.execute(USERS_PAGE_SQL, (limit, offset))
+                rows = db_cursor.fetchall()
+
+                # Convert rows to dict format
+                output_dict["users"] = [UserRow._make(row) for row in rows]
+
+                if len(rows) == limit:
+                    last_user = output_dict["users"][-1]
+                    output_dict["next_cursor"] = (last_user.last_updated or "", last_user.id)
+
+                return output_dict
+
+            except sqlite3.Error as e:
+                logger.error(f"Error retrieving users paginated: {e}")
+                raise
+
+    def update_user_profile(self, user_id: str, profile: dict) -> Optional[dict]:
         """
         Updates a user's profile fields.
 
+        Fields missing from profile, or set to None, are left unchanged.
+
         Args:
             user_id: The user's ID
             profile: Dictionary of profile fields to update
 
+        Returns:
+            dict | None: The updated profile, or None if nothing was updated
+
         Raises:
             sqlite3.Error: If update fails
         """
-        try:
-            cursor = self.connection.cursor()
-
-            # Build dynamic UPDATE query based on provided fields
-            fields = []
-            values = []
-
-            allowed_fields = [
-                "reportGroupList",
-                "firstName",
-                "lastName",
-                "mobilePhone",
-                "portalAccessGroup",
-                "secondEmail",
-                "ackNewBusiness",
-                "login",
-                "email",
-                "placementOrg",
-            ]
-
-            for field in allowed_fields:
-                if field in profile:
-                    fields.append(f"{field} = ?")
-                    values.append(profile[field])
-
-            if not fields:
-                logger.warning(f"No valid fields to update for user {user_id}")
-                return
-
-            values.append(user_id)
-            query = f"UPDATE user_profiles SET {', '.join(fields)} WHERE user_id = ?"
-
-            cursor.execute(query, values)
-            self.connection.commit()
-
-            logger.info(f"Updated profile for user: {user_id}")
+        values = tuple(profile.get(field) for field in PROFILE_UPDATE_FIELDS)
 
-        except sqlite3.Error as e:
-            self.connection.rollback()
-            logger.error(f"Error updating user profile: {e}")
-            raise
+        if all(value is None for value in values):
+            logger.warning(f"No valid fields to update for user {user_id}")
+            return None
+
+        with self._lock:
+            try:
+                cursor = self._cursor
+                # Same SQL text on every call so the prepared statement is reused
+                if SUPPORTS_RETURNING:
+                    cursor.execute(UPDATE_USER_PROFILE_SQL + PROFILE_RETURNING_SQL, values + (user_id,))
+                    updated_profile = cursor.fetchone()
+                else:
+                    cursor.execute(UPDATE_USER_PROFILE_SQL, values + (user_id,))
+                self.connection.commit()
+
+                logger.info(f"Updated profile for user: {user_id}")
+
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error updating user profile: {e}")
+                raise
+
+        if not SUPPORTS_RETURNING:
+            user = self.get_user_by_id(user_id)
+            return user["profile"] if user else None
+        return self._profile_row_to_dict(updated_profile) if updated_profile else None
 
     def delete_user(self, user_id: str) -> None:
         """
@@ -324,53 +577,72 @@ class UsersRepository:
         Raises:
             sqlite3.Error: If deletion fails
         """
-        try:
-            cursor = self.connection.cursor()
-
-            # Delete from user_profiles first (foreign key constraint)
-            cursor.execute("DELETE FROM user_profiles WHERE user_id = ?", (user_id,))
-
-            # Delete from users
-            cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        with self._lock:
+            try:
+                cursor = self._cursor
+                cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
+                cursor.execute(STORE_USER_COUNT_SQL)
 
-            self.connection.commit()
-            logger.info(f"Deleted user: {user_id}")
+                self.connection.commit()
+                logger.info(f"Deleted user: {user_id}")
 
-        except sqlite3.Error as e:
-            self.connection.rollback()
-            logger.error(f"Error deleting user: {e}")
-            raise
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error deleting user: {e}")
+                raise
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
         """
         Converts a database row to a user dictionary.
 
+        The row is unpacked positionally, so it must follow the column order of SELECT_USERS_SQL.
+
         Args:
             row: SQLite Row object
 
         Returns:
             dict: User data formatted like Okta API response
         """
+        return UserRow._make(row).to_api_dict()
+
+    @staticmethod
+    def _profile_row_to_dict(row: sqlite3.Row | tuple) -> dict:
+        """
+        Converts the profile columns of a row to a profile dictionary.
+
+        Args:
+            row: Profile columns in PROFILE_RETURNING_SQL order
+
+        Returns:
+            dict: Profile data formatted like Okta API response
+        """
+        (
+            report_group_list, first_name, last_name, mobile_phone,
+            portal_access_group, second_email, ack_new_business, login, email, placement_org,
+        ) = row
         return {
-            "id": row["id"],
-            "status": row["status"],
-            "created": row["created"],
-            "activated": row["activated"],
-            "statusChanged": row["statusChanged"],
-            "lastLogin": row["lastLogin"],
-            "lastUpdated": row["lastUpdated"],
-            "passwordChanged": row["passwordChanged"],
-            "type": {"id": row["type_id"]} if row["type_id"] else None,
-            "profile": {
-                "reportGroupList": row["reportGroupList"],
-                "firstName": row["firstName"],
-                "lastName": row["lastName"],
-                "mobilePhone": row["mobilePhone"],
-                "portalAccessGroup": row["portalAccessGroup"],
-                "secondEmail": row["secondEmail"],
-                "ackNewBusiness": row["ackNewBusiness"],
-                "login": row["login"],
-                "email": row["email"],
-                "placementOrg": row["placementOrg"],
-            },
+            "reportGroupList": report_group_list,
+            "firstName": first_name,
+            "lastName": last_name,
+            "mobilePhone": mobile_phone,
+            "portalAccessGroup": portal_access_group,
+            "secondEmail": second_email,
+            "ackNewBusiness": ack_new_business,
+            "login": login,
+            "email": email,
+            "placementOrg": placement_org,
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_users_repository() -> UsersRepository:
+    """
+    Returns the process-wide users repository.
+
+    Every repository shares the single database connection anyway, so one
+    instance (and its cached cursor) serves all commands.
+
+    Returns:
+        UsersRepository: The shared repository
+    """
+    return UsersRepository()
@@ -1,9 +1,100 @@
 import sqlite3
 import logging
 import os
+import threading
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Secondary indexes on frequently queried columns, keyed by index name.
+# Kept separate from the table DDL so bulk loads can drop and recreate them.
+USER_INDEXES = {
+    "idx_users_status": "CREATE INDEX IF NOT EXISTS idx_users_status ON users(status)",
+    "idx_users_email": "CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)",
+    "idx_users_login": "CREATE INDEX IF NOT EXISTS idx_users_login ON users(login)",
+    # Ordering for keyset pagination in get_all_users_paginated. The expression
+    # must match USERS_PAGE_KEY_SQL exactly for SQLite to use the index.
+    "idx_users_page_order": (
+        "CREATE INDEX IF NOT EXISTS idx_users_page_order"
+        " ON users(COALESCE(lastUpdated, '') DESC, id DESC)"
+    ),
+}
+
+
+# Each user has exactly one profile and one type, so everything lives in one row
+# and reads need no join. Column order matches SELECT_USERS_SQL in UsersRepository.
+# A text primary key makes it a WITHOUT ROWID table, so a lookup by id walks a
+# single B-tree. {name} lets the migration build a copy under a temporary name.
+USERS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id TEXT PRIMARY KEY,
+        status TEXT,
+        created TEXT,
+        activated TEXT,
+        statusChanged TEXT,
+        lastLogin TEXT,
+        lastUpdated TEXT,
+        passwordChanged TEXT,
+        type_id TEXT,
+        reportGroupList TEXT,
+        firstName TEXT,
+        lastName TEXT,
+        mobilePhone TEXT,
+        portalAccessGroup TEXT,
+        secondEmail TEXT,
+        ackNewBusiness INTEGER,
+        login TEXT,
+        email TEXT,
+        placementOrg TEXT
+    ) WITHOUT ROWID
+"""
+
+# Bump when SCHEMA_SQL changes so existing databases re-run schema initialization
+SCHEMA_VERSION = 3
+
+# Total rows in users, cached in the metadata table because count(*) walks the whole table
+STORE_USER_COUNT_SQL = (
+    "INSERT OR REPLACE INTO metadata (key, value) SELECT 'user_count', count(*) FROM users"
+)
+
+# Full schema, created with IF NOT EXISTS so it is safe to re-run
+SCHEMA_SQL = (
+    """
+    -- Config table for storing Okta credentials
+    CREATE TABLE IF NOT EXISTS config (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        api_key TEXT NOT NULL,
+        app_url TEXT NOT NULL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Derived values cached between runs (e.g. the user count)
+    CREATE TABLE IF NOT EXISTS metadata (
+        key TEXT PRIMARY KEY,
+        value
+    );
+    """
+    + USERS_TABLE_SQL.format(name="users") + ";\n"
+    # Replaced by idx_users_page_order, which also orders rows without a lastUpdated
+    + "DROP INDEX IF EXISTS idx_users_updated_id;\n"
+    + "".join(f"{index_sql};\n" for index_sql in USER_INDEXES.values())
+    + f"{STORE_USER_COUNT_SQL};\n"
+)
+
+# Copies users + user_profiles from the old three-table layout into the merged table
+MIGRATE_LEGACY_USERS_SQL = """
+    INSERT INTO users_new
+    SELECT
+        u.id, u.status, u.created, u.activated, u.statusChanged,
+        u.lastLogin, u.lastUpdated, u.passwordChanged, u.type_id,
+        p.reportGroupList, p.firstName, p.lastName, p.mobilePhone,
+        p.portalAccessGroup, p.secondEmail, p.ackNewBusiness, p.login, p.email,
+        COALESCE(p.placementOrg, u.placementOrg)
+    FROM users u
+    LEFT JOIN user_profiles p ON u.id = p.user_id
+"""
+
 
 class SqliteDatabase:
     """
@@ -14,81 +105,44 @@ class SqliteDatabase:
 
     def __init__(self, db_path: str = "oktacli.db") -> None:
         self.db_path = db_path
-        self.connection = sqlite3.connect(db_path)
+        # A larger statement cache keeps every repository query prepared for the process lifetime.
+        # One connection is shared by all threads, serialized through self.lock, since
+        # separate connections would only contend for the WAL writer lock.
+        self.connection = sqlite3.connect(db_path, cached_statements=512, check_same_thread=False)
+        self.lock = threading.RLock()
         self.connection.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        self._configure_connection()
         self._initialize_schema()
 
+    def _configure_connection(self) -> None:
+        """
+        Applies connection-level PRAGMAs tuned for bulk sync writes and concurrent reads.
+        """
+        # WAL lets readers proceed while a sync is writing, and with
+        # synchronous=NORMAL a commit no longer waits on a full fsync
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self.connection.execute("PRAGMA cache_size=-64000")  # ~64 MB page cache
+        self.connection.execute("PRAGMA mmap_size=268435456")  # 256 MB
+
     def _initialize_schema(self) -> None:
         """
         Initializes the database schema if tables don't exist.
+
+        Skipped entirely once PRAGMA user_version records the current SCHEMA_VERSION.
         """
         try:
-            cursor = self.connection.cursor()
-
-            # Create tables with IF NOT EXISTS to avoid errors on subsequent runs
-            # Config table for storing Okta credentials
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS config (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    api_key TEXT NOT NULL,
-                    app_url TEXT NOT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_types (
-                    id TEXT PRIMARY KEY
-                )
-            """)
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id TEXT PRIMARY KEY,
-                    status TEXT,
-                    created TEXT,
-                    activated TEXT,
-                    statusChanged TEXT,
-                    lastLogin TEXT,
-                    lastUpdated TEXT,
-                    passwordChanged TEXT,
-                    placementOrg TEXT,
-                    type_id TEXT,
-                    FOREIGN KEY (type_id) REFERENCES user_types(id)
-                )
-            """)
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS user_profiles (
-                    user_id TEXT PRIMARY KEY,
-                    reportGroupList TEXT,
-                    firstName TEXT,
-                    lastName TEXT,
-                    mobilePhone TEXT,
-                    portalAccessGroup TEXT,
-                    secondEmail TEXT,
-                    ackNewBusiness INTEGER,
-                    login TEXT,
-                    email TEXT,
-                    placementOrg TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Create indexes for frequently queried columns
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_users_status ON users(status)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_user_profiles_email ON user_profiles(email)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_user_profiles_login ON user_profiles(login)
-            """)
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+
+            # Merge the users tables of older databases into the single users table
+            self._migrate_legacy_tables()
 
+            # One script instead of a round trip per statement
+            self.connection.executescript(SCHEMA_SQL)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             self.connection.commit()
             logger.info("Database schema initialized successfully")
 
@@ -96,6 +150,45 @@ class SqliteDatabase:
             logger.error(f"Error initializing database schema: {e}")
             raise
 
+    def _migrate_legacy_tables(self) -> None:
+        """
+        Collapses the users, user_profiles and user_types tables of older databases
+        into the single users table.
+
+        Follows SQLite's table rebuild procedure: create the new table, copy the rows,
+        drop the old tables and rename the new one, with foreign keys off meanwhile.
+        """
+        row = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_profiles'"
+        ).fetchone()
+        if not row:
+            return
+
+        logger.info("Migrating users, user_profiles and user_types into a single users table")
+
+        # The legacy tables reference each other; make sure dropping them cannot
+        # cascade, in case this SQLite build enables foreign keys by default.
+        # foreign_keys cannot be changed inside a transaction.
+        self.connection.commit()
+        foreign_keys = self.connection.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.connection.execute("PRAGMA foreign_keys=OFF")
+        try:
+            self.connection.execute("BEGIN")
+            self.connection.execute(USERS_TABLE_SQL.format(name="users_new"))
+            self.connection.execute(MIGRATE_LEGACY_USERS_SQL)
+            self.connection.execute("DROP TABLE user_profiles")
+            self.connection.execute("DROP TABLE users")
+            self.connection.execute("DROP TABLE IF EXISTS user_types")
+            self.connection.execute("ALTER TABLE users_new RENAME TO users")
+            self.connection.commit()
+
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+
+        finally:
+            self.connection.execute(f"PRAGMA foreign_keys={foreign_keys}")
+
     def get_db_connection(self) -> sqlite3.Connection:
         """
         Returns the database connection.
@@ -105,6 +198,18 @@ class SqliteDatabase:
         """
         return self.connection
 
+    def get_db_lock(self) -> threading.RLock:
+        """
+        Returns the lock guarding the shared connection.
+
+        Hold it around every statement and its commit or rollback when the
+        connection may be used from more than one thread.
+
+        Returns:
+            threading.RLock: The connection lock
+        """
+        return self.lock
+
     def close(self) -> None:
         """
         Closes the database connection.
@@ -114,5 +219,23 @@ class SqliteDatabase:
             logger.info("Database connection closed")
 
 
-# Global database instance
-database = SqliteDatabase()
+# Process-wide database instance, opened on first use by get_database
+_database: Optional[SqliteDatabase] = None
+_database_lock = threading.Lock()
+
+
+def get_database() -> SqliteDatabase:
+    """
+    Returns the shared database, opening it and initializing the schema on first call.
+
+    Commands that never touch the local database then skip opening the file entirely.
+
+    Returns:
+        SqliteDatabase: The shared database instance
+    """
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = SqliteDatabase()
+    return _database
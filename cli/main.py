@@ -96,7 +96,7 @@ def main():
     sync_parser = users_subparser.add_parser(
         "sync",
         help="Sync all users from Okta to local database",
-        description="Fetches all users from Okta and syncs them to the local SQLite database using multi-threading",
+        description="Fetches all users from Okta and syncs them to the local SQLite database, prefetching pages while each one is written",
     )
     sync_parser.set_defaults(func=handle_sync_users)
 
@@ -118,6 +118,11 @@ def main():
         default=25,
         help="Number of users per page (default: 25)",
     )
+    list_parser.add_argument(
+        "--after",
+        type=str,
+        help="Continue after the cursor printed below the previous page (faster than --page on deep pages)",
+    )
     list_parser.add_argument(
         "--export",
         action="store_true",
@@ -135,7 +140,7 @@ def main():
     get_group.add_argument(
         "--id",
         type=str,
-        help="User ID to retrieve",
+        help="User ID to retrieve, or several comma-separated IDs",
     )
     get_group.add_argument(
         "--email",
@@ -188,6 +193,12 @@ def main():
         type=str,
         help="User email to delete",
     )
+    delete_parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Delete without asking for confirmation (for scripts)",
+    )
     delete_parser.set_defaults(func=handle_delete_user)
 
     # USERS RESET PASSWORD SUBCOMMAND
@@ -1,8 +1,9 @@
 from cli.exceptions import UserNotFoundError
 from .RequestClient import HttpRequestClient
-from typing import Callable, Any
-from ..validation import OktaUserResponse
-from cli.database import UsersRepository
+from typing import Iterator
+import orjson
+from ..validation import OktaUserResponse, SKIP_VALIDATION, USER_LIST_ADAPTER, ValidationError
+from cli.database.UsersRepository import get_users_repository
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,10 +23,13 @@ class OktaApi:
             base_url=api_url,
             base_headers={"Authorization": f"SSWS {api_key}"},
         )
+        self._users_client: "OktaUsers | None" = None
 
     def get_users_client(self) -> "OktaUsers":
-        """Returns the users API client."""
-        return OktaUsers(self.request_client)
+        """Returns the users API client, created once per OktaApi instance."""
+        if self._users_client is None:
+            self._users_client = OktaUsers(self.request_client)
+        return self._users_client
 
 
 class OktaUsers:
@@ -39,21 +43,135 @@ class OktaUsers:
         self.request_client = request_client
         self.base_path = "api/v1/users"
 
-    def get_users(self, cb: Callable | None = None) -> list[dict]:
+    def get_users(self, search: str | None = None, filter_expr: str | None = None) -> list[dict]:
         """
         Retrieves all users from Okta with automatic pagination.
 
+        Prefer iter_user_pages for large tenants, this holds every user in memory.
+
         Args:
-            cb: Optional callback function called with accumulated results
+            search: Okta search expression, evaluated server-side (e.g. 'profile.department eq "IT"')
+            filter_expr: Okta filter expression, evaluated server-side (e.g. 'status eq "ACTIVE"')
 
         Returns:
-            list[dict]: All users from Okta (dict format for compatibility)
+            list[dict]: All matching users from Okta (dict format for compatibility)
         """
         logger.info("Fetching all users from Okta")
-        users = self.request_client.get(self.base_path, cb=cb)
+        users = [
+            user
+            for page in self.iter_user_pages(search=search, filter_expr=filter_expr)
+            for user in page
+        ]
         logger.info(f"Retrieved {len(users)} users from Okta")
         return users
 
+    def iter_user_pages(
+        self,
+        page_size: int | None = None,
+        search: str | None = None,
+        filter_expr: str | None = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Retrieves all users from Okta one page at a time.
+
+        Only the current page is held in memory, and the caller can process it
+        while later pages are still being fetched.
+
+        Args:
+            page_size: Users per page; defaults to the endpoint's maximum (200)
+            search: Okta search expression, evaluated server-side
+            filter_expr: Okta filter expression, evaluated server-side
+
+        Yields:
+            list[dict]: Users of a single API page
+        """
+        logger.info("Streaming users from Okta")
+        yield from self.request_client.iter_pages(
+            self.base_path, params=self._list_params(page_size, search, filter_expr)
+        )
+
+    def iter_validated_user_pages(
+        self,
+        page_size: int | None = None,
+        search: str | None = None,
+        filter_expr: str | None = None,
+    ) -> Iterator[tuple[list[OktaUserResponse], int]]:
+        """
+        Retrieves all users from Okta one page at a time as validated models.
+
+        Each page is validated straight from the response bytes with
+        USER_LIST_ADAPTER.validate_json, so pydantic-core parses the JSON itself
+        and no intermediate dicts are built. If a page holds an invalid user, the
+        page is validated user by user instead and the invalid ones are logged
+        and skipped, so one bad record doesn't abort a whole listing. The number
+        skipped is yielded with each page so callers can report them as failed.
+
+        Args:
+            page_size: Users per page; defaults to the endpoint's maximum (200)
+            search: Okta search expression, evaluated server-side
+            filter_expr: Okta filter expression, evaluated server-side
+
+        Yields:
+            tuple: (valid users of a single API page, number of invalid users skipped)
+        """
+        logger.info("Streaming validated users from Okta")
+        for content in self.request_client.iter_page_contents(
+            self.base_path, params=self._list_params(page_size, search, filter_expr)
+        ):
+            if not content:
+                yield [], 0
+            elif SKIP_VALIDATION:
+                users = orjson.loads(content)
+                yield [OktaUserResponse.from_trusted(user_data) for user_data in users], 0
+            else:
+                try:
+                    yield USER_LIST_ADAPTER.validate_json(content), 0
+                except ValidationError:
+                    yield self._validate_each(orjson.loads(content))
+
+    @staticmethod
+    def _validate_each(page: list[dict]) -> tuple[list[OktaUserResponse], int]:
+        """
+        Validates the users of a page one at a time, dropping invalid ones.
+
+        Args:
+            page: Raw user data dictionaries from one list response
+
+        Returns:
+            tuple: (users that passed validation, number of invalid users skipped)
+        """
+        users = []
+        for user_data in page:
+            try:
+                users.append(OktaUserResponse.model_validate(user_data))
+            except ValidationError as e:
+                logger.warning(f"Skipping invalid user {user_data.get('id')}: {e}")
+        return users, len(page) - len(users)
+
+    @staticmethod
+    def _list_params(
+        page_size: int | None, search: str | None, filter_expr: str | None
+    ) -> dict | None:
+        """
+        Builds the query parameters of a users listing.
+
+        Args:
+            page_size: Users per page
+            search: Okta search expression
+            filter_expr: Okta filter expression
+
+        Returns:
+            dict | None: Query parameters, or None when all are defaults
+        """
+        params = {}
+        if page_size:
+            params["limit"] = page_size
+        if search:
+            params["search"] = search
+        if filter_expr:
+            params["filter"] = filter_expr
+        return params or None
+
     def get_user_by_id(self, user_id: str) -> dict | None:
         """
         Retrieves a single user by ID.
@@ -72,6 +190,24 @@ class OktaUsers:
         users = self.request_client.get(path)
         return users[0] if users else None
 
+    def get_users_by_ids(self, user_ids: list[str]) -> list[dict]:
+        """
+        Retrieves several users by ID with concurrent requests.
+
+        Args:
+            user_ids: The Okta user IDs
+
+        Returns:
+            list[dict]: User data, in the order of user_ids
+
+        Raises:
+            requests.HTTPError: If any user is not found or a request fails
+        """
+        logger.info(f"Fetching {len(user_ids)} users by ID")
+        return self.request_client.get_many(
+            f"{self.base_path}/{user_id}" for user_id in user_ids
+        )
+
     def get_user_by_email(self, email: str) -> dict | None:
         """
         Retrieves a single user by email address.
@@ -104,7 +240,8 @@ class OktaUsers:
         """
         logger.info(f"Updating user profile for user ID: {user_id}")
         path = f"{self.base_path}/{user_id}"
-        print(profile)
+        # Lazy %-formatting so the profile is only rendered when debug logging is on
+        logger.debug("Profile update payload: %s", profile)
         data = {"profile": profile}
         return self.request_client.post(path, data=data)
 
@@ -142,7 +279,7 @@ class OktaUsers:
         path = f"{self.base_path}/{user_id}/lifecycle/reset_password?sendEmail=true"
         r = self.request_client.post(path=path)
         logger.info(r)
-        return r.json()
+        return r
 
     def expire_user_password_with_new_password(self, user_id: str) -> str:
         """
@@ -156,7 +293,7 @@ class OktaUsers:
             requests.HTTPError: If the request fails
 
         """
-        repository = UsersRepository()
+        repository = get_users_repository()
         user = repository.get_user_by_id(user_id)
 
         if not user:
@@ -170,8 +307,7 @@ class OktaUsers:
         path = (
             f"{self.base_path}/{user_id}/lifecycle/expire_password_with_temp_password"
         )
-        response = self.request_client.post(path)
-        data = response.json()
+        data = self.request_client.post(path)
         return data["tempPassword"]
 
     @staticmethod
@@ -179,6 +315,8 @@ class OktaUsers:
         """
         Validates and parses a user response from Okta API using Pydantic.
 
+        With OKTA_SKIP_VALIDATION=1 the response is trusted and built without validation.
+
         Args:
             user_data: Raw user data dictionary from API
 
@@ -188,4 +326,6 @@ class OktaUsers:
         Raises:
             ValidationError: If the response doesn't match the expected schema
         """
-        return OktaUserResponse(**user_data)
+        if SKIP_VALIDATION:
+            return OktaUserResponse.from_trusted(user_data)
+        return OktaUserResponse.model_validate(user_data)
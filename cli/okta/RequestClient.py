@@ -1,33 +1,161 @@
-from requests import get, post, put, patch, delete
-from typing import Callable, Any
+import orjson
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for HTTP requests (in seconds)
 DEFAULT_TIMEOUT = 30
 
+# Concurrent requests issued by get_many
+GET_MANY_WORKERS = 8
+
+# Keep-alive pool for the single Okta host. Sized from the peak concurrency
+# (get_many workers plus a prefetching pagination thread) so no in-flight request
+# ever has its connection discarded and re-handshaken when it is returned.
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = GET_MANY_WORKERS + 1
+
+# Largest page size accepted by Okta list endpoints, keyed by path. Requested
+# automatically unless the caller passes its own "limit", cutting round trips
+# up to 10x compared to the endpoint's default page size.
+LIST_ENDPOINT_PAGE_SIZES = {
+    "api/v1/users": 200,
+}
+
+# Matches the "next" entry of a Link header; compiled once instead of letting
+# requests parse every rel into a dict on each page
+NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+# Longest wait for a rate-limit window to reset before retrying, in seconds
+MAX_RATE_LIMIT_WAIT = 60
+
+
+class OktaRetry(Retry):
+    """
+    Retry policy that also honours Okta's X-Rate-Limit-Reset header.
+
+    Okta throttles with 429 and reports when the window resets (epoch seconds)
+    in X-Rate-Limit-Reset, not always in Retry-After. Concurrent callers such as
+    get_many back off until the reset instead of retrying into the same limit.
+    """
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is not None or response.status != 429:
+            return retry_after
+
+        reset = response.headers.get("X-Rate-Limit-Reset")
+        try:
+            wait = float(reset) - time.time()
+        except (TypeError, ValueError):
+            return None
+        return min(max(wait, 0.0), MAX_RATE_LIMIT_WAIT)
+
+
+# Transient failures retried by the adapter, honouring Okta's rate-limit headers on 429.
+# Only idempotent methods are retried (urllib3's default), so POSTs are never replayed.
+RETRY_POLICY = OktaRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
 
 class HttpRequestClient:
     """
     HTTP client for making requests to the Okta API.
 
-    Handles pagination, error handling, and response parsing.
+    Handles pagination, error handling, and response parsing. All requests go
+    through one pooled session, so keep-alive connections and TLS sessions are
+    reused across pages and calls. Use as a context manager or call close().
     """
 
+    # Fixed attribute set, no per-instance __dict__
+    __slots__ = ("base_headers", "base_url", "timeout", "_session")
+
     def __init__(
-        self, base_headers: dict, base_url: str, timeout: int = DEFAULT_TIMEOUT
+        self,
+        base_headers: dict,
+        base_url: str,
+        timeout: int = DEFAULT_TIMEOUT,
     ) -> None:
         self.base_headers = base_headers
         self.base_url = base_url.rstrip("/")  # Remove trailing slash if present
         self.timeout = timeout
 
+        self._session = Session()
+        self._session.headers.update(base_headers)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RETRY_POLICY,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def __enter__(self) -> "HttpRequestClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the session and its pooled connections.
+        """
+        self._session.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        json: Any = None,
+        headers: dict | None = None,
+    ) -> Response:
+        """
+        Sends a request through the shared session and raises on HTTP errors.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            json: Request body, serialized as JSON
+            headers: Headers sent in addition to the session's base headers
+
+        Returns:
+            Response: The successful response
+
+        Raises:
+            requests.HTTPError: If the response status is an error
+        """
+        logger.debug(f"{method} {url}")
+        r = self._session.request(
+            method,
+            url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        r.raise_for_status()
+        return r
+
     def get(
         self,
         path: str = "",
         params: dict | None = None,
         headers: dict | None = None,
-        cb: Callable | None = None,
+        on_page: Callable[[list], None] | None = None,
     ) -> list:
         """
         Makes a GET request with automatic pagination support.
@@ -36,37 +164,179 @@ class HttpRequestClient:
             path: API endpoint path
             params: Query parameters
             headers: Additional headers to merge with base headers
-            cb: Optional callback function called with accumulated results
+            on_page: Called with the items of each page as it arrives
 
         Returns:
             list: Accumulated results from all pages
         """
-        params = params or {}
-        headers = headers or {}
-        _headers = self.base_headers | headers
-        _url = f"{self.base_url}/{path.lstrip('/')}"
-        results = []
+        return list(self.iter_get(path, params=params, headers=headers, on_page=on_page))
 
-        while _url:
-            logger.debug(f"GET {_url}")
-            r = get(_url, params=params, headers=_headers, timeout=self.timeout)
-            r.raise_for_status()
-            current_results = r.json()
+    def iter_get(
+        self,
+        path: str = "",
+        params: dict | None = None,
+        headers: dict | None = None,
+        on_page: Callable[[list], None] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Makes paginated GET requests, yielding individual results as they arrive.
+
+        Streaming callers hold at most one page in memory instead of the whole listing.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers to merge with base headers
+            on_page: Called with the items of each page (not the running total) as it arrives
+
+        Yields:
+            Each result object, in API order
+        """
+        for page in self.iter_pages(path, params=params, headers=headers):
+            if on_page:
+                on_page(page)
+            yield from page
+
+    def iter_pages(
+        self,
+        path: str = "",
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> Iterator[list]:
+        """
+        Makes paginated GET requests, yielding each page as soon as it arrives.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers to merge with base headers
+
+        Yields:
+            list: Results of one page (single objects are wrapped in a list)
+        """
+        for content in self.iter_page_contents(path, params=params, headers=headers):
+            # An empty body is an empty page, not a single None result
+            if not content:
+                yield []
+                continue
+
+            current_results = orjson.loads(content)
 
             # Handle both single objects and arrays
             if isinstance(current_results, list):
-                results.extend(current_results)
+                yield current_results
             else:
-                results.append(current_results)
+                yield [current_results]
+
+    def iter_page_contents(
+        self,
+        path: str = "",
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Makes paginated GET requests, yielding the raw JSON body of each page.
+
+        Follows the Link "next" header one hop at a time, so only a single page
+        is held in memory and callers can process it before the next request.
+        Known list endpoints are asked for their maximum page size. For callers
+        that parse the bytes themselves (e.g. pydantic's validate_json), so no
+        intermediate Python objects are built.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            headers: Additional headers to merge with base headers
+
+        Yields:
+            bytes: Response body of one page
+        """
+        _url = f"{self.base_url}/{path.lstrip('/')}"
+
+        page_size = LIST_ENDPOINT_PAGE_SIZES.get(path.strip("/"))
+        if page_size and not (params and "limit" in params):
+            params = {"limit": page_size, **(params or {})}
+
+        while _url:
+            r = self._request("GET", _url, params=params, headers=headers)
+            yield r.content
+
+            # Get next page URL from Link header. It already carries every query parameter
+            # (including the "after" cursor), so params are only sent with the first request.
+            _url = self._next_link(r)
+            params = None
+
+    @staticmethod
+    def _decode(response: Response) -> Any:
+        """
+        Decodes a JSON response body with orjson, straight from the raw bytes.
+
+        Skips requests' r.json(), which decodes the body to text before parsing it
+        with the slower stdlib json module.
+
+        Args:
+            response: Response to decode
+
+        Returns:
+            Decoded JSON data, or None for an empty body
+        """
+        if not response.content:
+            return None
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _next_link(response: Response) -> str | None:
+        """
+        Extracts the "next" page URL from a response's Link header.
+
+        Args:
+            response: Response of a paginated request
+
+        Returns:
+            str | None: The next page URL, or None on the last page
+        """
+        link = response.headers.get("Link")
+        if not link or 'rel="next"' not in link:
+            return None
+        match = NEXT_LINK_RE.search(link)
+        return match.group(1) if match else None
 
-            if cb:
-                cb(results)
+    def get_many(
+        self,
+        paths: Iterable[str],
+        params: dict | None = None,
+        headers: dict | None = None,
+        max_workers: int = GET_MANY_WORKERS,
+    ) -> list[Any]:
+        """
+        Makes independent single-resource GET requests concurrently.
+
+        Okta paginates with opaque "after" cursors, so the pages of one listing
+        cannot be fetched in parallel; this instead overlaps the round trips of
+        separate requests (e.g. several users by ID) on the pooled session.
+
+        Args:
+            paths: API endpoint paths, one request each
+            params: Query parameters sent with every request
+            headers: Additional headers to merge with base headers
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            list: Response JSON data, in the order of paths
+
+        Raises:
+            requests.HTTPError: If any request fails
+        """
+        urls = [f"{self.base_url}/{path.lstrip('/')}" for path in paths]
 
-            # Get next page URL from Link header
-            next_link = r.links.get("next", {}).get("url")
-            _url = next_link
+        def fetch(url: str) -> Any:
+            return self._decode(self._request("GET", url, params=params, headers=headers))
 
-        return results
+        if len(urls) <= 1:
+            return [fetch(url) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(fetch, urls))
 
     def post(
         self,
@@ -87,18 +357,9 @@ class HttpRequestClient:
         Returns:
             Response JSON data
         """
-        params = params or {}
-        data = data or {}
-        headers = headers or {}
-        _headers = self.base_headers | {"Content-Type": "application/json"} | headers
         _url = f"{self.base_url}/{path.lstrip('/')}"
-
-        logger.debug(f"POST {_url}")
-        logger.info(_url)
-        r = post(_url, json=data, params=params, headers=_headers, timeout=self.timeout)
-        r.raise_for_status()
-
-        return r.json()
+        r = self._request("POST", _url, params=params, json=data or {}, headers=headers)
+        return self._decode(r)
 
     def patch(
         self,
@@ -119,19 +380,9 @@ class HttpRequestClient:
         Returns:
             Response JSON data
         """
-        params = params or {}
-        data = data or {}
-        headers = headers or {}
-        _headers = self.base_headers | {"Content-Type": "application/json"} | headers
         _url = f"{self.base_url}/{path.lstrip('/')}"
-
-        logger.debug(f"PATCH {_url}")
-        r = patch(
-            _url, json=data, params=params, headers=_headers, timeout=self.timeout
-        )
-        r.raise_for_status()
-
-        return r.json()
+        r = self._request("PATCH", _url, params=params, json=data or {}, headers=headers)
+        return self._decode(r)
 
     def put(
         self,
@@ -152,17 +403,9 @@ class HttpRequestClient:
         Returns:
             Response JSON data
         """
-        params = params or {}
-        data = data or {}
-        headers = headers or {}
-        _headers = self.base_headers | {"Content-Type": "application/json"} | headers
         _url = f"{self.base_url}/{path.lstrip('/')}"
-
-        logger.debug(f"PUT {_url}")
-        r = put(_url, json=data, params=params, headers=_headers, timeout=self.timeout)
-        r.raise_for_status()
-
-        return r.json()
+        r = self._request("PUT", _url, params=params, json=data or {}, headers=headers)
+        return self._decode(r)
 
     def delete(
         self,
@@ -183,24 +426,11 @@ class HttpRequestClient:
         Returns:
             None (DELETE typically returns 204 No Content)
         """
-        params = params or {}
-        data = data or {}
-        headers = headers or {}
-        _headers = self.base_headers | headers
         _url = f"{self.base_url}/{path.lstrip('/')}"
-
-        logger.debug(f"DELETE {_url}")
-        r = delete(
-            _url,
-            json=data if data else None,
-            params=params,
-            headers=_headers,
-            timeout=self.timeout,
-        )
-        r.raise_for_status()
+        r = self._request("DELETE", _url, params=params, json=data or None, headers=headers)
 
         # DELETE typically returns 204 No Content
         if r.status_code >= 200 and r.status_code < 400:
             return None
 
-        return r.json() if r.text else None
+        return self._decode(r)
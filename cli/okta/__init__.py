@@ -1,3 +1,4 @@
+import functools
 from .OktaApi import OktaApi
 from ..config import get_local_config
 
@@ -13,7 +14,22 @@ def get_okta_client() -> OktaApi:
         Exception: If configuration is not found
     """
     local_config = get_local_config()
-    return OktaApi(api_key=local_config.api_key, api_url=str(local_config.app_url))
+    return _create_okta_client(local_config.api_key, local_config.app_url)
+
+
+@functools.lru_cache(maxsize=4)
+def _create_okta_client(api_key: str, api_url: str) -> OktaApi:
+    """
+    Creates an Okta API client, reusing the existing one for the same credentials.
+
+    Args:
+        api_key: The Okta API key
+        api_url: The Okta organization URL
+
+    Returns:
+        OktaApi: Configured Okta API client
+    """
+    return OktaApi(api_key=api_key, api_url=api_url)
 
 
 __all__ = ["OktaApi", "get_okta_client"]
@@ -4,9 +4,18 @@ Update management module for the Okta CLI.
 Handles checking for updates from GitHub and self-updating the CLI tool.
 """
 
-from .version_checker import check_for_updates, get_current_version, get_latest_version
-from .installer import install_update
-from .commands import handle_update_command, check_for_updates_on_startup
+import importlib
+
+# Public names and the submodule defining them. Submodules are imported on first
+# attribute access (PEP 562), so importing cli.updater at startup stays cheap.
+_LAZY_ATTRIBUTES = {
+    "check_for_updates": "version_checker",
+    "get_current_version": "version_checker",
+    "get_latest_version": "version_checker",
+    "install_update": "installer",
+    "handle_update_command": "commands",
+    "check_for_updates_on_startup": "commands",
+}
 
 __all__ = [
     "check_for_updates",
@@ -16,3 +25,12 @@ __all__ = [
     "handle_update_command",
     "check_for_updates_on_startup",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
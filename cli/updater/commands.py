@@ -2,19 +2,43 @@
 Command handlers for update-related operations.
 """
 
+import atexit
 import logging
 import sys
+import threading
 from argparse import Namespace
 
-from rich.console import Console
-from rich.table import Table
-
 from ..exceptions import UpdateCheckError, InstallationError
-from .version_checker import check_for_updates, get_current_version
-from .installer import install_update, get_rollback_instructions
+from .config import (
+    get_update_config,
+    get_update_hint,
+    save_update_hint,
+    should_check_for_updates,
+)
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+# Seconds the process waits at exit for a startup update check still in flight
+UPDATE_CHECK_EXIT_WAIT = 1.0
+
+# Created on first output; rich, requests and the installer are only imported
+# when there is something to show or an update check actually runs
+_console_instance = None
+
+
+def _console():
+    """
+    Returns the shared rich console, creating it on first use.
+
+    Returns:
+        Console: The rich console
+    """
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
 
 
 def handle_update_command(args: Namespace) -> None:
@@ -24,6 +48,12 @@ def handle_update_command(args: Namespace) -> None:
     Args:
         args: Command line arguments with check and force flags
     """
+    from rich.table import Table
+
+    from .installer import get_rollback_instructions, install_update
+    from .version_checker import check_for_updates, get_current_version
+
+    console = _console()
     try:
         check_only = getattr(args, "check", False)
         force = getattr(args, "force", False)
@@ -101,20 +131,62 @@ def check_for_updates_on_startup() -> None:
     """
     Performs a non-intrusive update check on CLI startup.
 
-    Only shows a message if an update is available.
+    Shows the update found by the previous check, if any, and runs a new check
+    in a background thread so the GitHub request overlaps with the command.
+    At exit, waits up to UPDATE_CHECK_EXIT_WAIT seconds for the check to finish.
     Does not interrupt user workflow.
     """
     try:
+        config = get_update_config()
+        if not config.get("auto_check_updates", True):
+            return
+
+        hint = get_update_hint()
+        if hint:
+            from .version_checker import compare_versions, get_current_version
+
+            latest_version = hint.get("version")
+            # Skip hints made stale by an upgrade since the check
+            if latest_version and compare_versions(get_current_version(), latest_version) < 0:
+                _console().print(
+                    f"\n[dim]💡 Update available: [bold]{latest_version}[/bold]. "
+                    f"Run 'okta update' to upgrade.[/dim]\n"
+                )
+
+        # Config-only cooldown check first, most startups stop here
+        if not should_check_for_updates(force=False):
+            return
+
+        thread = threading.Thread(
+            target=_background_update_check,
+            name="update-check",
+            daemon=True,
+        )
+        thread.start()
+        # Short commands finish before the check does. Let it save its result and
+        # the cooldown on exit, but never hold the command up for long on a slow network.
+        atexit.register(thread.join, UPDATE_CHECK_EXIT_WAIT)
+
+    except Exception as e:
+        # Silently fail - don't interrupt user workflow
+        logger.debug(f"Startup update check failed: {e}")
+
+
+def _background_update_check() -> None:
+    """
+    Checks for updates and stores the result for the next startup to display.
+    """
+    try:
+        from .version_checker import check_for_updates
+
         # Check for updates (respects cooldown period)
         update_info = check_for_updates(force=False)
 
         if update_info:
-            latest_version, _ = update_info
-            console.print(
-                f"\n[dim]💡 Update available: [bold]{latest_version}[/bold]. "
-                f"Run 'okta update' to upgrade.[/dim]\n"
-            )
+            latest_version, download_url = update_info
+            save_update_hint(latest_version, download_url)
+        else:
+            save_update_hint(None)
 
     except Exception as e:
-        # Silently fail - don't interrupt user workflow
         logger.debug(f"Background update check failed: {e}")
@@ -7,8 +7,8 @@ Handles reading and writing update-related settings.
 import json
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,10 @@ CONFIG_DIR = os.path.join(
     "okta-cli",
 )
 UPDATE_CONFIG_PATH = os.path.join(CONFIG_DIR, "update_config.json")
+# Last GitHub release response, replayed when GitHub answers 304 Not Modified
+RELEASE_CACHE_PATH = os.path.join(CONFIG_DIR, "release_cache.json")
+# Result of the last background update check, shown on the next startup
+UPDATE_HINT_PATH = os.path.join(CONFIG_DIR, "update_hint.json")
 
 # Default configuration
 DEFAULT_UPDATE_CONFIG = {
@@ -26,13 +30,31 @@ DEFAULT_UPDATE_CONFIG = {
     "last_update_check": None,
 }
 
+# Update config as last read or written by this process, loaded on first access
+_config_cache: Dict[str, Any] | None = None
+
 
 def get_update_config() -> Dict[str, Any]:
     """
     Retrieves the update configuration.
 
+    The file is read once per process; later calls are served from memory.
+
+    Returns:
+        Dict[str, Any]: Update configuration dictionary (a copy, safe to modify)
+    """
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = _load_update_config()
+    return _config_cache.copy()
+
+
+def _load_update_config() -> Dict[str, Any]:
+    """
+    Reads the update configuration file.
+
     Returns:
-        Dict[str, Any]: Update configuration dictionary
+        Dict[str, Any]: Update configuration merged over the defaults
     """
     try:
         if os.path.exists(UPDATE_CONFIG_PATH):
@@ -49,6 +71,14 @@ def get_update_config() -> Dict[str, Any]:
         return DEFAULT_UPDATE_CONFIG.copy()
 
 
+def invalidate_config_cache() -> None:
+    """
+    Drops the in-process update config so the next read goes to disk.
+    """
+    global _config_cache
+    _config_cache = None
+
+
 def save_update_config(config: Dict[str, Any]) -> None:
     """
     Saves the update configuration.
@@ -56,6 +86,7 @@ def save_update_config(config: Dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary to save
     """
+    global _config_cache
     try:
         # Ensure config directory exists
         os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
@@ -64,6 +95,7 @@ def save_update_config(config: Dict[str, Any]) -> None:
         with open(UPDATE_CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2)
 
+        _config_cache = config.copy()
         logger.debug(f"Update config saved to {UPDATE_CONFIG_PATH}")
 
     except Exception as e:
@@ -118,3 +150,141 @@ def set_check_interval(seconds: int) -> None:
 
     except Exception as e:
         logger.error(f"Failed to set check interval: {e}")
+
+
+def get_release_cache() -> Dict[str, Any]:
+    """
+    Retrieves the cached GitHub release response.
+
+    Returns:
+        Dict[str, Any]: Cache with "etag", "last_modified" and "body" keys, or an empty dict
+    """
+    try:
+        with open(RELEASE_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.debug(f"Failed to read release cache: {e}")
+        return {}
+
+
+def save_release_cache(etag: str | None, last_modified: str | None, body: Dict[str, Any]) -> None:
+    """
+    Saves a GitHub release response along with its validators.
+
+    Args:
+        etag: ETag response header
+        last_modified: Last-Modified response header
+        body: Release fields to replay on a 304 response
+    """
+    try:
+        os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
+
+        cache = {"etag": etag, "last_modified": last_modified, "body": body}
+        with open(RELEASE_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+
+    except Exception as e:
+        logger.warning(f"Failed to save release cache: {e}")
+
+
+def get_update_hint() -> Optional[Dict[str, Any]]:
+    """
+    Retrieves the update found by the last background check.
+
+    Returns:
+        Optional[Dict[str, Any]]: Hint with "version", "url" and "checked_at" keys, or None
+    """
+    try:
+        with open(UPDATE_HINT_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Failed to read update hint: {e}")
+        return None
+
+
+def save_update_hint(version: Optional[str], url: Optional[str] = None) -> None:
+    """
+    Records the result of a background update check.
+
+    Written to a temporary file and renamed into place, so a process exiting
+    mid-write never leaves a truncated hint behind.
+
+    Args:
+        version: Latest available version, or None to clear the hint
+        url: Release page of the latest version
+    """
+    try:
+        if version is None:
+            if os.path.exists(UPDATE_HINT_PATH):
+                os.remove(UPDATE_HINT_PATH)
+            return
+
+        os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
+
+        hint = {
+            "version": version,
+            "url": url,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+        }
+        temp_path = f"{UPDATE_HINT_PATH}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(hint, f, indent=2)
+        os.replace(temp_path, UPDATE_HINT_PATH)
+
+    except Exception as e:
+        logger.debug(f"Failed to save update hint: {e}")
+
+
+def should_check_for_updates(force: bool = False) -> bool:
+    """
+    Determines if we should check for updates based on cooldown period.
+
+    Args:
+        force: If True, ignore cooldown period
+
+    Returns:
+        bool: True if should check, False otherwise
+    """
+    if force:
+        return True
+
+    try:
+        config = get_update_config()
+
+        # Check if auto-check is disabled
+        if not config.get("auto_check_updates", True):
+            logger.debug("Auto-check for updates is disabled")
+            return False
+
+        last_check = config.get("last_update_check")
+        if not last_check:
+            # Never checked before
+            return True
+
+        # Parse last check time
+        last_check_time = datetime.fromisoformat(last_check)
+        # Ensure timezone-aware comparison
+        if last_check_time.tzinfo is None:
+            last_check_time = last_check_time.replace(tzinfo=timezone.utc)
+
+        check_interval = config.get("update_check_interval", 86400)  # Default 24 hours
+        next_check_time = last_check_time + timedelta(seconds=check_interval)
+
+        # Use timezone-aware current time
+        now = datetime.now(timezone.utc)
+        should_check = now >= next_check_time
+
+        if not should_check:
+            logger.debug(f"Skipping update check. Next check at: {next_check_time}")
+
+        return should_check
+
+    except Exception as e:
+        logger.debug(f"Error checking update cooldown: {e}. Allowing check.")
+        return True  # If we can't determine, allow the check
@@ -4,9 +4,11 @@ Installation module for the Okta CLI updater.
 Handles downloading and installing updates.
 """
 
+import functools
 import logging
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ..exceptions import InstallationError
@@ -19,57 +21,66 @@ GITHUB_REPO = "tanasievlad246/okta-api-cli"
 SUBPROCESS_TIMEOUT = 300  # 5 minutes for install operations
 
 
+# Installer probes in priority order: (installer, command, whether the output
+# must list the package). "pip show" exits non-zero when the package is missing.
+INSTALLER_PROBES = (
+    ("uv", ["uv", "tool", "list"], True),
+    ("pipx", ["pipx", "list"], True),
+    ("pip", ["pip", "show", PACKAGE_NAME], False),
+)
+PROBE_TIMEOUT = 10  # seconds
+
+
+def _run_probe(name: str, command: list[str], check_output: bool) -> bool:
+    """
+    Runs a single installer probe.
+
+    Args:
+        name: Installer name, used for logging
+        command: Command listing the packages managed by the installer
+        check_output: Whether PACKAGE_NAME must appear in the command output
+
+    Returns:
+        bool: True if the CLI was installed with this installer
+    """
+    try:
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT
+        )
+        return result.returncode == 0 and (not check_output or PACKAGE_NAME in result.stdout)
+    except (subprocess.TimeoutExpired, Exception) as e:
+        logger.debug(f"Failed to check {name}: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def detect_installer() -> Optional[str]:
     """
     Detects which package manager was used to install the CLI.
 
+    The available installers are probed concurrently, but the result still
+    follows the uv > pipx > pip priority order. The answer is cached for the
+    process; call detect_installer.cache_clear() to probe again.
+
     Returns:
         Optional[str]: Name of installer ("uv", "pipx", "pip") or None if not found
     """
-    # Check if installed via uv
-    if shutil.which("uv"):
-        try:
-            result = subprocess.run(
-                ["uv", "tool", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0 and PACKAGE_NAME in result.stdout:
-                logger.debug("CLI installed via uv")
-                return "uv"
-        except (subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"Failed to check uv: {e}")
-
-    # Check if installed via pipx
-    if shutil.which("pipx"):
-        try:
-            result = subprocess.run(
-                ["pipx", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0 and PACKAGE_NAME in result.stdout:
-                logger.debug("CLI installed via pipx")
-                return "pipx"
-        except (subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"Failed to check pipx: {e}")
-
-    # Check if installed via pip
-    if shutil.which("pip"):
+    probes = [probe for probe in INSTALLER_PROBES if shutil.which(probe[0])]
+
+    if probes:
+        executor = ThreadPoolExecutor(max_workers=len(probes))
         try:
-            result = subprocess.run(
-                ["pip", "show", PACKAGE_NAME],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                logger.debug("CLI installed via pip")
-                return "pip"
-        except (subprocess.TimeoutExpired, Exception) as e:
-            logger.debug(f"Failed to check pip: {e}")
+            futures = [(probe[0], executor.submit(_run_probe, *probe)) for probe in probes]
+            for name, future in futures:
+                if future.result():
+                    logger.debug(f"CLI installed via {name}")
+                    return name
+        finally:
+            # Don't wait on lower-priority probes once a match is found
+            executor.shutdown(wait=False, cancel_futures=True)
 
     logger.warning("Could not detect package installer")
     return None
@@ -119,24 +130,10 @@ def _install_with_uv() -> None:
     """
     github_url = f"git+https://github.com/{GITHUB_REPO}.git"
 
-    # First, uninstall the current version
-    try:
-        subprocess.run(
-            ["uv", "tool", "uninstall", PACKAGE_NAME],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-    except subprocess.CalledProcessError:
-        # If uninstall fails, it might not be installed as a tool, continue anyway
-        logger.debug("Could not uninstall with uv tool, may not be installed as tool")
-    except subprocess.TimeoutExpired:
-        logger.warning("Uninstall timed out, continuing with install")
-
-    # Install the new version
+    # --force replaces the existing tool in place and --reinstall refetches the git
+    # source, so no separate uninstall process is needed
     subprocess.run(
-        ["uv", "tool", "install", github_url],
+        ["uv", "tool", "install", "--force", "--reinstall", github_url],
         check=True,
         capture_output=True,
         text=True,
@@ -153,24 +150,16 @@ def _install_with_pipx() -> None:
     """
     github_url = f"git+https://github.com/{GITHUB_REPO}.git"
 
-    # pipx supports upgrade command
-    result = subprocess.run(
-        ["pipx", "upgrade", PACKAGE_NAME],
+    # install --force reinstalls over an existing pipx install, or installs fresh,
+    # in one process instead of trying upgrade first
+    subprocess.run(
+        ["pipx", "install", "--force", github_url],
+        check=True,
         capture_output=True,
         text=True,
         timeout=SUBPROCESS_TIMEOUT
     )
 
-    # If upgrade fails (package not installed with pipx), try install
-    if result.returncode != 0:
-        subprocess.run(
-            ["pipx", "install", github_url, "--force"],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT
-        )
-
 
 def _install_with_pip() -> None:
     """
@@ -4,14 +4,20 @@ Version checking module for the Okta CLI.
 Handles checking for new versions from GitHub releases.
 """
 
+import functools
 import logging
+import re
 import requests
 from typing import Optional, Tuple
-from datetime import datetime, timedelta, timezone
 import cli
 
 from ..exceptions import UpdateCheckError
-from .config import get_update_config, save_last_check_time
+from .config import (
+    get_release_cache,
+    save_last_check_time,
+    save_release_cache,
+    should_check_for_updates,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,10 @@ GITHUB_REPO = "tanasievlad246/okta-api-cli"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 REQUEST_TIMEOUT = 10  # seconds
 
+# "1.2.3", "v1.2", "1.2.3-rc1", "1.2.3b2"; compiled once and reused by every comparison
+VERSION_RE = re.compile(r"^v?(?P<release>\d+(?:\.\d+)*)(?:[-_.+]?(?P<pre>[0-9A-Za-z][0-9A-Za-z.-]*))?$")
+PRERELEASE_TOKEN_RE = re.compile(r"\d+|[A-Za-z]+")
+
 
 def get_current_version() -> str:
     """
@@ -44,14 +54,7 @@ def get_latest_version() -> Tuple[str, str]:
     try:
         logger.debug(f"Fetching latest version from {GITHUB_API_URL}")
 
-        response = requests.get(
-            GITHUB_API_URL,
-            timeout=REQUEST_TIMEOUT,
-            headers={"Accept": "application/vnd.github+json"}
-        )
-        response.raise_for_status()
-
-        data = response.json()
+        data = _fetch_latest_release()
         tag_name = data.get("tag_name", "").lstrip("v")  # Remove 'v' prefix if present
         html_url = data.get("html_url", "")
 
@@ -72,85 +75,100 @@ def get_latest_version() -> Tuple[str, str]:
         raise UpdateCheckError("Failed to parse version information from GitHub")
 
 
-def compare_versions(current: str, latest: str) -> int:
+def _fetch_latest_release() -> dict:
     """
-    Compares two semantic version strings.
+    Fetches the latest release with a conditional GET against the on-disk cache.
 
-    Args:
-        current: Current version string (e.g., "0.1.0")
-        latest: Latest version string (e.g., "0.2.0")
+    GitHub answers 304 Not Modified when the cached ETag/Last-Modified still match,
+    which skips the release payload and does not count against the rate limit.
 
     Returns:
-        int: -1 if current < latest, 0 if equal, 1 if current > latest
+        dict: Release data with at least "tag_name" and "html_url"
+
+    Raises:
+        requests.RequestException: If the request fails
     """
-    try:
-        current_parts = [int(x) for x in current.split(".")]
-        latest_parts = [int(x) for x in latest.split(".")]
-
-        # Pad with zeros if needed to compare same length
-        max_len = max(len(current_parts), len(latest_parts))
-        current_parts.extend([0] * (max_len - len(current_parts)))
-        latest_parts.extend([0] * (max_len - len(latest_parts)))
-
-        if current_parts < latest_parts:
-            return -1
-        elif current_parts > latest_parts:
-            return 1
-        else:
-            return 0
+    cache = get_release_cache()
+    headers = {"Accept": "application/vnd.github+json"}
+    if cache.get("body"):
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
 
-    except (ValueError, AttributeError) as e:
-        logger.error(f"Failed to compare versions: {e}")
-        return 0  # Assume equal if we can't parse
+    response = requests.get(GITHUB_API_URL, timeout=REQUEST_TIMEOUT, headers=headers)
 
+    if response.status_code == 304:
+        logger.debug("Latest release unchanged, using cached response")
+        return cache["body"]
 
-def should_check_for_updates(force: bool = False) -> bool:
+    response.raise_for_status()
+
+    data = response.json()
+    save_release_cache(
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        {"tag_name": data.get("tag_name", ""), "html_url": data.get("html_url", "")},
+    )
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _version_key(version: str) -> tuple:
     """
-    Determines if we should check for updates based on cooldown period.
+    Parses a version string into a sortable key.
+
+    Trailing zero components are dropped so "1.0" equals "1.0.0", and a
+    prerelease ("1.2.0-rc1", "1.2.0b2") sorts before the final release.
 
     Args:
-        force: If True, ignore cooldown period
+        version: Version string, optionally prefixed with "v"
 
     Returns:
-        bool: True if should check, False otherwise
-    """
-    if force:
-        return True
+        tuple: (release components, 1 for a final release else 0, prerelease tokens)
 
-    try:
-        config = get_update_config()
+    Raises:
+        ValueError: If the string is not a version
+    """
+    match = VERSION_RE.match(version.strip())
+    if not match:
+        raise ValueError(f"Invalid version: {version!r}")
 
-        # Check if auto-check is disabled
-        if not config.get("auto_check_updates", True):
-            logger.debug("Auto-check for updates is disabled")
-            return False
+    release = [int(part) for part in match.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
 
-        last_check = config.get("last_update_check")
-        if not last_check:
-            # Never checked before
-            return True
+    prerelease = match.group("pre")
+    if not prerelease:
+        return tuple(release), 1, ()
 
-        # Parse last check time
-        last_check_time = datetime.fromisoformat(last_check)
-        # Ensure timezone-aware comparison
-        if last_check_time.tzinfo is None:
-            last_check_time = last_check_time.replace(tzinfo=timezone.utc)
+    # Numbers compare numerically and before words, so "rc2" < "rc10"
+    tokens = tuple(
+        (0, int(token), "") if token.isdigit() else (1, 0, token.lower())
+        for token in PRERELEASE_TOKEN_RE.findall(prerelease)
+    )
+    return tuple(release), 0, tokens
 
-        check_interval = config.get("update_check_interval", 86400)  # Default 24 hours
-        next_check_time = last_check_time + timedelta(seconds=check_interval)
 
-        # Use timezone-aware current time
-        now = datetime.now(timezone.utc)
-        should_check = now >= next_check_time
+def compare_versions(current: str, latest: str) -> int:
+    """
+    Compares two semantic version strings.
 
-        if not should_check:
-            logger.debug(f"Skipping update check. Next check at: {next_check_time}")
+    Args:
+        current: Current version string (e.g., "0.1.0")
+        latest: Latest version string (e.g., "0.2.0")
 
-        return should_check
+    Returns:
+        int: -1 if current < latest, 0 if equal, 1 if current > latest
+    """
+    try:
+        current_key = _version_key(current)
+        latest_key = _version_key(latest)
+        return (current_key > latest_key) - (current_key < latest_key)
 
-    except Exception as e:
-        logger.debug(f"Error checking update cooldown: {e}. Allowing check.")
-        return True  # If we can't determine, allow the check
+    except (ValueError, AttributeError) as e:
+        logger.error(f"Failed to compare versions: {e}")
+        return 0  # Assume equal if we can't parse
 
 
 def check_for_updates(force: bool = False) -> Optional[Tuple[str, str]]:
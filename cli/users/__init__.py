@@ -4,30 +4,112 @@ User management module for the Okta CLI.
 Handles all user-related commands including sync, get, update, and delete.
 """
 
-import json
 import logging
 import os
+import select
+import sys
 from typing import Dict, Any, List
 from argparse import Namespace
 from datetime import date
+from operator import attrgetter
 import csv
 
+import orjson
+from requests import RequestException
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..okta import get_okta_client
-from ..database.UsersRepository import UsersRepository
+from ..okta.OktaApi import OktaUsers
+from ..database.UsersRepository import UsersRepository, get_users_repository
 from ..exceptions import UserNotFoundError, ValidationError
+from ..validation import OktaUserResponse, UserQueryModel
+from ..utils import prefetch
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# CSV export columns
+EXPORT_FIELDNAMES = (
+    "id",
+    "status",
+    "firstName",
+    "lastName",
+    "email",
+    "login",
+    "mobilePhone",
+    "created",
+    "lastUpdated",
+    "lastLogin",
+    "placementOrg",
+    "portalAccessGroup",
+)
+# UserRow fields in EXPORT_FIELDNAMES order, read with one C-level call per row
+_export_row = attrgetter(
+    "id",
+    "status",
+    "first_name",
+    "last_name",
+    "email",
+    "login",
+    "mobile_phone",
+    "created",
+    "last_updated",
+    "last_login",
+    "placement_org",
+    "portal_access_group",
+)
+EXPORT_BUFFER_SIZE = 1 << 20  # 1 MB
+EXPORT_CHUNK_SIZE = 1000  # rows read from the database per fetch
+
+# Rows of the single user table: (label, key, whether the key is in profile)
+USER_DETAIL_FIELDS = (
+    ("ID", "id", False),
+    ("Status", "status", False),
+    ("First Name", "firstName", True),
+    ("Last Name", "lastName", True),
+    ("Email", "email", True),
+    ("Login", "login", True),
+    ("Mobile Phone", "mobilePhone", True),
+    ("Created", "created", False),
+    ("Last Updated", "lastUpdated", False),
+    ("Last Login", "lastLogin", False),
+    ("Placement Org", "placementOrg", True),
+    ("Portal Access Groups", "portalAccessGroup", True),
+)
+
+# Columns of the paginated users table: (header, rich column options)
+USER_LIST_COLUMNS = (
+    ("ID", {"style": "cyan", "overflow": "fold", "max_width": 15}),
+    ("Status", {"style": "green"}),
+    ("First Name", {"style": "white"}),
+    ("Last Name", {"style": "white"}),
+    ("Email", {"style": "blue", "overflow": "fold"}),
+    ("Mobile Phone", {"style": "white"}),
+    ("Placement Org", {"style": "yellow", "overflow": "fold"}),
+    ("Last Login", {"style": "dim", "overflow": "fold", "max_width": 20}),
+)
+# UserRow fields shown between the Status and Last Login columns
+_user_list_profile_values = attrgetter(
+    "first_name", "last_name", "email", "mobile_phone", "placement_org"
+)
+
+# Seconds to wait for an answer to a confirmation prompt before treating it as "no"
+CONFIRM_TIMEOUT = 30
+
+# Number of Okta pages fetched ahead while the previous page is written to the database
+SYNC_PREFETCH_PAGES = 2
+
 
 def handle_sync_users(args: Namespace) -> None:
     """
-    Syncs users from Okta to the local database using multi-threading.
+    Syncs users from Okta to the local database.
+
+    A single background thread prefetches the next Okta pages while the main
+    thread writes the current one. Writes stay on one thread: SQLite allows a
+    single writer, so parallel upserts would only queue on the connection lock.
 
     Args:
         args: Command line arguments from argparse
@@ -35,12 +117,15 @@ def handle_sync_users(args: Namespace) -> None:
     try:
         console.print("[bold blue]Starting user sync from Okta...[/bold blue]")
 
-        # Get Okta client and users
-        okta_client = get_okta_client()
-        users_client = okta_client.get_users_client()
+        users_client = _get_users_client()
+
+        # Pages are fetched in a background thread so the next HTTP request
+        # overlaps with writing the current page, one transaction per page
+        repository = get_users_repository()
+        fetched_count = 0
+        synced_count = 0
+        failed_count = 0
 
-        # Fetch users from Okta with progress indicator
-        users = []
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -48,43 +133,36 @@ def handle_sync_users(args: Namespace) -> None:
         ) as progress:
             task = progress.add_task("Fetching users from Okta API...", total=None)
 
-            def collect_users(accumulated_users):
-                progress.update(
-                    task, description=f"Fetched {len(accumulated_users)} users..."
+            # Indexes are rebuilt once at the end instead of per inserted row
+            repository.begin_bulk_load()
+            try:
+                # Pages arrive as validated models, parsed straight from the response bytes
+                pages = prefetch(
+                    users_client.iter_validated_user_pages(), depth=SYNC_PREFETCH_PAGES
                 )
-
-            users = users_client.get_users(cb=collect_users)
-            progress.update(task, description=f"Fetched {len(users)} users total")
-
-        if not users:
+                for page, invalid_count in pages:
+                    # Users that failed validation were fetched but never reach the database
+                    fetched_count += len(page) + invalid_count
+                    failed_count += invalid_count
+                    synced, failed = _sync_page(repository, page)
+                    synced_count += synced
+                    failed_count += failed
+
+                    progress.update(
+                        task,
+                        description=f"Fetched {fetched_count} users, synced {synced_count}...",
+                    )
+            finally:
+                progress.update(task, description="Rebuilding indexes...")
+                repository.end_bulk_load()
+
+            progress.update(task, description=f"Fetched {fetched_count} users total")
+
+        if not fetched_count:
             console.print("[yellow]No users found in Okta[/yellow]")
             return
 
-        console.print(f"[green]✓[/green] Retrieved {len(users)} users from Okta")
-
-        # Sync users to database using ThreadPoolExecutor
-        repository = UsersRepository()
-        synced_count = 0
-        failed_count = 0
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Syncing users to database...", total=len(users))
-
-            for user in users:
-                try:
-                    _sync_user(repository=repository, user=user)
-                    synced_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Failed to sync user {user.get('id')}: {e}")
-
-                progress.update(task, advance=1)
+        console.print(f"[green]✓[/green] Retrieved {fetched_count} users from Okta")
 
         console.print(f"\n[bold green]✓ Sync completed![/bold green]")
         console.print(f"  • Synced: {synced_count} users")
@@ -97,15 +175,45 @@ def handle_sync_users(args: Namespace) -> None:
         raise
 
 
-def _sync_user(repository: UsersRepository, user: Dict[str, Any]) -> None:
+def _get_users_client() -> OktaUsers:
+    """
+    Returns the users API client of the shared Okta client.
+
+    Returns:
+        OktaUsers: Users API client for the configured org
     """
-    Helper function to sync a single user to the database.
+    return get_okta_client().get_users_client()
+
+
+def _sync_page(repository: UsersRepository, page: List[OktaUserResponse]) -> tuple[int, int]:
+    """
+    Writes one page of users, falling back to per-user upserts if the batch fails.
+
+    The batch is rolled back as a whole on error, so retrying row by row keeps
+    the good users of the page and only counts the bad ones as failed.
 
     Args:
-        repository: UsersRepository instance
-        user: User data dictionary from Okta API
+        repository: Users repository to write to
+        page: Users of one Okta API page
+
+    Returns:
+        tuple[int, int]: (synced count, failed count)
     """
-    repository.create_or_update_user(user)
+    try:
+        return repository.bulk_upsert_users(page), 0
+    except Exception as e:
+        logger.warning(f"Batch upsert of {len(page)} users failed, retrying one by one: {e}")
+
+    synced_count = 0
+    failed_count = 0
+    for user in page:
+        try:
+            repository.create_or_update_user(user)
+            synced_count += 1
+        except Exception as e:
+            failed_count += 1
+            logger.error(f"Failed to sync user {user.id}: {e}")
+    return synced_count, failed_count
 
 
 def handle_get_user(args: Namespace) -> None:
@@ -116,54 +224,60 @@ def handle_get_user(args: Namespace) -> None:
         args: Command line arguments with id, email, and source flags from argparse
     """
     try:
+        repository = get_users_repository()
         source = args.source if hasattr(args, "source") else "db"
         user = None
 
-        if source == "api":
-            # Fetch from Okta API
-            okta_client = get_okta_client()
-            users_client = okta_client.get_users_client()
+        if args.id and "," in args.id:
+            _get_users_bulk(repository, args.id, source)
+            return
 
-            if args.id:
-                console.print(f"[blue]Fetching user {args.id} from Okta API...[/blue]")
-                user = users_client.get_user_by_id(args.id)
+        query = _parse_user_query(args)
 
-                # Sync to database
-                if user:
-                    repository = UsersRepository()
-                    repository.create_or_update_user(user)
-                    console.print("[dim]✓ User synced to local database[/dim]\n")
-
-            elif args.email:
+        if source == "api":
+            # Fetch from Okta API
+            users_client = _get_users_client()
+            field, value = ("id", query.id) if query.id else ("email", query.email)
+
+            console.print(f"[blue]Fetching user {value} from Okta API...[/blue]")
+            try:
+                if field == "id":
+                    user = users_client.get_user_by_id(value)
+                else:
+                    user = users_client.get_user_by_email(value)
+            except RequestException as e:
+                if not _is_okta_unavailable(e):
+                    raise
+                # Okta is down or throttling, show the last synced copy instead
+                user = (
+                    repository.get_user_by_id(value)
+                    if field == "id"
+                    else repository.get_user_by_email(value)
+                )
+                if not user:
+                    raise
+                logger.warning(f"Okta API unavailable, using local copy of user {value}: {e}")
                 console.print(
-                    f"[blue]Fetching user {args.email} from Okta API...[/blue]"
+                    "[yellow]⚠ Okta API unavailable, showing local database copy (stale)[/yellow]\n"
                 )
-                user = users_client.get_user_by_email(args.email)
-
+            else:
                 # Sync to database
                 if user:
-                    repository = UsersRepository()
                     repository.create_or_update_user(user)
                     console.print("[dim]✓ User synced to local database[/dim]\n")
-            else:
-                raise ValidationError("Either --id or --email must be provided")
 
         else:
             # Fetch from local database
-            repository = UsersRepository()
-
-            if args.id:
+            if query.id:
                 console.print(
-                    f"[blue]Fetching user {args.id} from local database...[/blue]"
+                    f"[blue]Fetching user {query.id} from local database...[/blue]"
                 )
-                user = repository.get_user_by_id(args.id)
-            elif args.email:
+                user = repository.get_user_by_id(query.id)
+            else:
                 console.print(
-                    f"[blue]Fetching user {args.email} from local database...[/blue]"
+                    f"[blue]Fetching user {query.email} from local database...[/blue]"
                 )
-                user = repository.get_user_by_email(args.email)
-            else:
-                raise ValidationError("Either --id or --email must be provided")
+                user = repository.get_user_by_email(query.email)
 
         if not user:
             console.print("[yellow]User not found[/yellow]")
@@ -178,6 +292,78 @@ def handle_get_user(args: Namespace) -> None:
         raise
 
 
+def _parse_user_query(args: Namespace) -> UserQueryModel:
+    """
+    Builds the user lookup from the --id and --email arguments.
+
+    Args:
+        args: Command line arguments with id and email from argparse
+
+    Returns:
+        UserQueryModel: Query with exactly one of id or email set
+
+    Raises:
+        ValidationError: If neither or both are given, or the email is malformed
+    """
+    try:
+        return UserQueryModel.parse(id=args.id, email=args.email)
+    except ValueError as e:
+        raise ValidationError(str(e))
+
+
+def _get_users_bulk(repository: UsersRepository, ids: str, source: str) -> None:
+    """
+    Retrieves and displays several users given as a comma-separated --id list.
+
+    From the API the users are fetched concurrently and synced to the database
+    in one batch.
+
+    Args:
+        repository: Users repository
+        ids: Comma-separated user IDs
+        source: "api" for Okta API, "db" for local database
+
+    Raises:
+        ValidationError: If the list contains no IDs
+        UserNotFoundError: If a user is not in the local database
+    """
+    user_ids = [user_id for user_id in (part.strip() for part in ids.split(",")) if user_id]
+    if not user_ids:
+        raise ValidationError("--id must contain at least one user ID")
+
+    if source == "api":
+        console.print(f"[blue]Fetching {len(user_ids)} users from Okta API...[/blue]")
+        users = _get_users_client().get_users_by_ids(user_ids)
+        repository.bulk_upsert_users(users)
+        console.print(f"[dim]✓ {len(users)} users synced to local database[/dim]\n")
+    else:
+        console.print(f"[blue]Fetching {len(user_ids)} users from local database...[/blue]")
+        users = [repository.get_user_by_id(user_id) for user_id in user_ids]
+        missing = [user_id for user_id, user in zip(user_ids, users) if not user]
+        if missing:
+            console.print("[yellow]User not found[/yellow]")
+            raise UserNotFoundError(f"Users not found: {', '.join(missing)}")
+
+    for user in users:
+        _display_user(user)
+
+
+def _is_okta_unavailable(error: RequestException) -> bool:
+    """
+    Tells whether a failed request means Okta is unreachable rather than the user missing.
+
+    Args:
+        error: The request error
+
+    Returns:
+        bool: True for connection errors, timeouts, throttling and server errors
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
 def handle_update_user(args: Namespace) -> None:
     """
     Updates a user's profile in both Okta and the local database.
@@ -194,19 +380,18 @@ def handle_update_user(args: Namespace) -> None:
 
         # Parse profile JSON
         try:
-            profile = json.loads(args.profile)
-        except json.JSONDecodeError as e:
+            profile = orjson.loads(args.profile)
+        except orjson.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in --profile: {e}")
 
         console.print(f"[blue]Updating user {args.id}...[/blue]")
 
         # Update in Okta
-        okta_client = get_okta_client()
-        users_client = okta_client.get_users_client()
+        users_client = _get_users_client()
         updated_user = users_client.update_user(args.id, profile)
 
         # Update in local database
-        repository = UsersRepository()
+        repository = get_users_repository()
         repository.update_user_profile(args.id, profile)
 
         console.print(
@@ -225,8 +410,7 @@ def handle_password_reset(args: Namespace):
         if not args.id:
             raise ValidationError("--id is required for password reset")
 
-        okta_client = get_okta_client()
-        users_client = okta_client.get_users_client()
+        users_client = _get_users_client()
         password_reset_reponse = users_client.reset_user_password(args.id)
         console.log(password_reset_reponse)
         console.print(
@@ -245,42 +429,34 @@ def handle_delete_user(args: Namespace) -> None:
         args: Command line arguments with id or email from argparse
     """
     try:
-        user_id = None
+        repository = get_users_repository()
+        query = _parse_user_query(args)
 
         # Get user ID
-        if args.id:
-            user_id = args.id
-        elif args.email:
+        if query.id:
+            user_id = query.id
+        else:
             # Look up user by email first
-            repository = UsersRepository()
-            user = repository.get_user_by_email(args.email)
+            user = repository.get_user_by_email(query.email)
             if user:
                 user_id = user["id"]
             else:
-                raise UserNotFoundError(f"User with email {args.email} not found")
-        else:
-            raise ValidationError("Either --id or --email must be provided")
+                raise UserNotFoundError(f"User with email {query.email} not found")
 
         # Confirm deletion
-        console.print(
-            f"[yellow]⚠ Are you sure you want to delete user {user_id}? (y/N):[/yellow] ",
-            end="",
-        )
-        confirmation = input().strip().lower()
-
-        if confirmation != "y":
+        if not args.yes and not _confirm(
+            f"[yellow]⚠ Are you sure you want to delete user {user_id}? (y/N):[/yellow] "
+        ):
             console.print("[dim]Deletion cancelled[/dim]")
             return
 
         console.print(f"[blue]Deleting user {user_id}...[/blue]")
 
         # Delete from Okta
-        okta_client = get_okta_client()
-        users_client = okta_client.get_users_client()
+        users_client = _get_users_client()
         users_client.delete_user(user_id)
 
         # Delete from local database
-        repository = UsersRepository()
         repository.delete_user(user_id)
 
         console.print(
@@ -293,6 +469,39 @@ def handle_delete_user(args: Namespace) -> None:
         raise
 
 
+def _confirm(prompt: str, timeout: float = CONFIRM_TIMEOUT) -> bool:
+    """
+    Asks a yes/no question on stdin, giving up after timeout seconds.
+
+    A closed stdin or no answer in time counts as "no", so unattended runs
+    (CI, cron, piped input) fail fast instead of hanging on the prompt.
+
+    Args:
+        prompt: Question shown to the user
+        timeout: Seconds to wait for an answer
+
+    Returns:
+        bool: True if the user answered "y"
+    """
+    console.print(prompt, end="")
+    try:
+        # select() cannot poll console handles on Windows, so wait without a timeout there
+        if sys.platform != "win32":
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if not ready:
+                console.print()
+                logger.warning(f"No confirmation received within {timeout}s")
+                return False
+            answer = sys.stdin.readline()
+        else:
+            answer = input()
+    except (EOFError, OSError, ValueError):
+        # No usable stdin (closed, detached or not selectable)
+        console.print()
+        return False
+    return answer.strip().lower() == "y"
+
+
 def _display_user(user: Dict[str, Any]) -> None:
     """
     Displays user information in a formatted table.
@@ -306,24 +515,10 @@ def _display_user(user: Dict[str, Any]) -> None:
     table.add_column("Field", style="cyan", width=20)
     table.add_column("Value", style="green")
 
-    # Basic info
-    table.add_row("ID", user.get("id", "N/A"))
-    table.add_row("Status", user.get("status", "N/A"))
-
-    # Profile info
-    profile = user.get("profile", {})
-    table.add_row("First Name", profile.get("firstName", "N/A"))
-    table.add_row("Last Name", profile.get("lastName", "N/A"))
-    table.add_row("Email", profile.get("email", "N/A"))
-    table.add_row("Login", profile.get("login", "N/A"))
-    table.add_row("Mobile Phone", profile.get("mobilePhone", "N/A"))
-
-    # Timestamps
-    table.add_row("Created", user.get("created", "N/A"))
-    table.add_row("Last Updated", user.get("lastUpdated", "N/A"))
-    table.add_row("Last Login", user.get("lastLogin", "N/A"))
-    table.add_row("Placement Org", profile.get("placementOrg", "N/A"))
-    table.add_row("Portal Access Groups", profile.get("portalAccessGroup", "N/A"))
+    profile = user.get("profile") or {}
+    for label, key, in_profile in USER_DETAIL_FIELDS:
+        source = profile if in_profile else user
+        table.add_row(label, source.get(key) or "N/A")
 
     console.print(table)
 
@@ -358,65 +553,40 @@ def list_users(args: Namespace) -> None:
         args: Command line arguments with page, limit, or export to export users to a csv file
     """
     try:
-        repository = UsersRepository()
+        repository = get_users_repository()
 
         if args.export:
             console.print("[blue]Exporting all users to CSV...[/blue]")
-            users = repository.get_all_users()
+            users = repository.iter_all_users(EXPORT_CHUNK_SIZE)
 
-            if not users:
+            first_user = next(users, None)
+            if first_user is None:
                 console.print("[yellow]No users found to export[/yellow]")
                 return
 
-            # Define CSV columns
-            fieldnames = [
-                "id",
-                "status",
-                "firstName",
-                "lastName",
-                "email",
-                "login",
-                "mobilePhone",
-                "created",
-                "lastUpdated",
-                "lastLogin",
-                "placementOrg",
-                "portalAccessGroup",
-            ]
-
             filename = f"okta_users_export_{date.today()}.csv"
             filepath = os.path.join(os.getcwd(), filename)
 
-            with open(filepath, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
+            # Large buffer so rows are flushed to disk in big writes
+            with open(filepath, "w", newline="", buffering=EXPORT_BUFFER_SIZE, encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_FIELDNAMES)
+                writer.writerow(_export_row(first_user))
+                exported_count = 1
+                # Rows are streamed from the database straight into the file
                 for user in users:
-                    profile = user.get("profile", {})
-                    row = {
-                        "id": user.get("id", ""),
-                        "status": user.get("status", ""),
-                        "firstName": profile.get("firstName", ""),
-                        "lastName": profile.get("lastName", ""),
-                        "email": profile.get("email", ""),
-                        "login": profile.get("login", ""),
-                        "mobilePhone": profile.get("mobilePhone", ""),
-                        "created": user.get("created", ""),
-                        "lastUpdated": user.get("lastUpdated", ""),
-                        "lastLogin": user.get("lastLogin", ""),
-                        "placementOrg": profile.get("placementOrg", ""),
-                        "portalAccessGroup": profile.get("portalAccessGroup", ""),
-                    }
-                    writer.writerow(row)
-
-            console.print(f"[bold green]✓ Exported {len(users)} users to {filename}[/bold green]")
+                    writer.writerow(_export_row(user))
+                    exported_count += 1
+
+            console.print(f"[bold green]✓ Exported {exported_count} users to {filename}[/bold green]")
             return
 
         # Paginated display
         limit = args.limit if hasattr(args, 'limit') and args.limit is not None else 25
         page = args.page if hasattr(args, 'page') and args.page is not None else 1
+        cursor = _parse_list_cursor(args.after) if getattr(args, "after", None) else None
 
-        result = repository.get_all_users_paginated(limit, page)
+        result = repository.get_all_users_paginated(limit, page, cursor)
         _print_users_profile_table(result)
 
     except Exception as e:
@@ -425,6 +595,26 @@ def list_users(args: Namespace) -> None:
         raise
 
 
+def _parse_list_cursor(value: str) -> tuple[str, str]:
+    """
+    Parses an --after cursor printed by _print_users_profile_table.
+
+    Args:
+        value: Cursor in "<lastUpdated>,<id>" form
+
+    Returns:
+        tuple: (lastUpdated, id) of the last user on the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    # lastUpdated is empty for users Okta returned without one
+    last_updated, separator, user_id = value.rpartition(",")
+    if not separator or not user_id:
+        raise ValidationError(f"Invalid --after cursor: {value}")
+    return last_updated, user_id
+
+
 def _print_users_profile_table(result: dict) -> None:
     """
     Displays a paginated table of users with their profile information.
@@ -435,42 +625,37 @@ def _print_users_profile_table(result: dict) -> None:
     users = result.get("users", [])
     total_users = result.get("total_users", 0)
     total_pages = result.get("total_pages", 0)
-    current_page = result.get("current_page", 1)
+    current_page = result.get("current_page")
+    next_cursor = result.get("next_cursor")
 
     if not users:
         console.print("[yellow]No users found[/yellow]")
         return
 
     # Create table with pagination info in title
-    title = f"Users (Page {current_page} of {total_pages} | Total: {total_users})"
+    if current_page is None:
+        title = f"Users ({total_pages} pages | Total: {total_users})"
+    else:
+        title = f"Users (Page {current_page} of {total_pages} | Total: {total_users})"
     table = Table(title=title, show_header=True, header_style="bold magenta")
 
-    # Add columns
-    table.add_column("ID", style="cyan", overflow="fold", max_width=15)
-    table.add_column("Status", style="green")
-    table.add_column("First Name", style="white")
-    table.add_column("Last Name", style="white")
-    table.add_column("Email", style="blue", overflow="fold")
-    table.add_column("Mobile Phone", style="white")
-    table.add_column("Placement Org", style="yellow", overflow="fold")
-    table.add_column("Last Login", style="dim", overflow="fold", max_width=20)
-
-    # Add rows
+    for header, column_options in USER_LIST_COLUMNS:
+        table.add_column(header, **column_options)
+
     for user in users:
-        profile = user.get("profile", {})
+        last_login = user.last_login
         table.add_row(
-            user.get("id", "N/A")[:15],  # Truncate long IDs
-            user.get("status", "N/A"),
-            profile.get("firstName", "N/A"),
-            profile.get("lastName", "N/A"),
-            profile.get("email", "N/A"),
-            profile.get("mobilePhone", "N/A"),
-            profile.get("placementOrg", "N/A"),
-            user.get("lastLogin", "N/A")[:19] if user.get("lastLogin") else "N/A",  # Show date only
+            (user.id or "N/A")[:15],  # Truncate long IDs
+            user.status or "N/A",
+            *(value or "N/A" for value in _user_list_profile_values(user)),
+            last_login[:19] if last_login else "N/A",  # Drop the milliseconds
         )
 
     console.print(table)
 
+    if next_cursor:
+        console.print(f"[dim]Next page: --after {next_cursor[0]},{next_cursor[1]}[/dim]")
+
 def handler_set_temp_password(args: Namespace) -> None:
     """
     Sets a temporary password for a user and displays it.
@@ -485,12 +670,11 @@ def handler_set_temp_password(args: Namespace) -> None:
         console.print(f"[blue]Generating temporary password for user {args.id}...[/blue]")
 
         # Get Okta client and generate temp password
-        okta_client = get_okta_client()
-        users_client = okta_client.get_users_client()
+        users_client = _get_users_client()
         temp_password = users_client.expire_user_password_with_new_password(args.id)
 
         # Get user info to display email
-        repository = UsersRepository()
+        repository = get_users_repository()
         user = repository.get_user_by_id(args.id)
 
         console.print(f"[bold green]✓ Temporary password generated successfully![/bold green]\n")
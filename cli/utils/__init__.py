@@ -1,5 +1,6 @@
 """Utility modules for the Okta CLI."""
 
 from .logger import setup_logging, get_logger
+from .concurrency import prefetch
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = ["setup_logging", "get_logger", "prefetch"]
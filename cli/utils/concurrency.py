@@ -0,0 +1,68 @@
+"""
+Concurrency helpers for the Okta CLI application.
+"""
+
+import threading
+from queue import Full, Queue
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Markers for entries passed from the producer thread to the consumer
+_ITEM = "item"
+_ERROR = "error"
+_DONE = "done"
+
+
+def prefetch(iterable: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """
+    Iterates over an iterable in a background thread, keeping up to depth items ready.
+
+    Lets slow producers (e.g. paginated HTTP requests) run while the caller is
+    still processing the previous item. Exceptions raised by the producer are
+    re-raised in the caller.
+
+    Args:
+        iterable: Source of items, consumed in a daemon thread
+        depth: Maximum number of items buffered ahead of the caller
+
+    Yields:
+        Items of the iterable, in order
+    """
+    queue: Queue = Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        # Poll so the producer notices when the consumer has stopped early
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((_ITEM, item)):
+                    return
+        except BaseException as e:
+            put((_ERROR, e))
+        else:
+            put((_DONE, None))
+
+    thread = threading.Thread(target=produce, name="prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            kind, value = queue.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        stop.set()
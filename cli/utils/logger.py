@@ -2,9 +2,16 @@
 Logging configuration for the Okta CLI application.
 """
 
+import atexit
 import logging
+import logging.handlers
 import sys
 
+LOG_FILE = "oktacli.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Records buffered before being written to the log file; errors flush immediately
+LOG_BUFFER_CAPACITY = 1024
+
 
 def setup_logging(verbose: bool = False) -> None:
     """
@@ -15,13 +22,25 @@ def setup_logging(verbose: bool = False) -> None:
     """
     level = logging.DEBUG if verbose else logging.INFO
 
+    # delay=True: the log file is only opened once the first record is written.
+    # The buffer batches file writes instead of one write per record.
+    file_handler = logging.FileHandler(LOG_FILE, delay=True)
+    # The buffer hands records to the file handler, which formats them itself
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffer_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+    atexit.register(buffer_handler.flush)
+
     # Configure root logger
     logging.basicConfig(
         level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler("oktacli.log"),
+            buffer_handler,
         ],
     )
 
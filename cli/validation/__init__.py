@@ -1,40 +1,172 @@
-from pydantic import BaseModel, Field, HttpUrl, EmailStr, ValidationError
-from typing import Optional
+from pydantic import (
+    AfterValidator,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+from typing import Annotated, Literal, NamedTuple, Optional
 from datetime import datetime
+from urllib.parse import urlsplit
+import os
+import re
+
+# Set OKTA_SKIP_VALIDATION=1 to build Okta responses without validation (see from_trusted)
+SKIP_VALIDATION = os.environ.get("OKTA_SKIP_VALIDATION") == "1"
+
+# Shape check for email fields. Okta already validates addresses, so a cheap
+# precompiled regex replaces EmailStr and the email-validator dependency.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(value: Optional[str]) -> Optional[str]:
+    """
+    Validates that a string looks like an email address.
+
+    Args:
+        value: Email address, None and empty strings are passed through
+
+    Returns:
+        str | None: The unchanged value
+
+    Raises:
+        ValueError: If the value is not an email address
+    """
+    if value and not EMAIL_RE.match(value):
+        raise ValueError(f"value is not a valid email address: {value}")
+    return value
+
+
+# Email field type. Every field annotated with it shares the one validator above,
+# and values stay plain str (a RootModel would wrap each address in a model).
+OktaEmail = Annotated[str, AfterValidator(_check_email)]
+
+# User lifecycle statuses returned by the Okta Users API
+OktaStatus = Literal[
+    "ACTIVE",
+    "PROVISIONED",
+    "LOCKED_OUT",
+    "PASSWORD_EXPIRED",
+    "RECOVERY",
+    "STAGED",
+    "DEPROVISIONED",
+    "SUSPENDED",
+]
+
+# Okta response models are read-only snapshots. Their core schemas are built on
+# first use rather than at import, which most commands never reach. Keys the
+# CLI never reads (_links, _embedded, custom profile attributes) are dropped
+# by pydantic-core instead of being copied into __pydantic_extra__.
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, defer_build=True, extra="ignore")
 
 
 class ConfigModel(BaseModel):
     """Configuration model for Okta API credentials."""
 
     api_key: str
-    app_url: HttpUrl
+    app_url: str
+
+    @field_validator("app_url")
+    @classmethod
+    def _validate_app_url(cls, value: str) -> str:
+        """
+        Checks that app_url is an absolute http(s) URL and strips trailing slashes.
+
+        A plain str stays a str for the HTTP client, and normalizing here means
+        paths can be appended without stripping on every request.
+
+        Args:
+            value: The Okta organization URL
 
+        Returns:
+            str: The URL without trailing slashes
 
-class UserQueryModel(BaseModel):
-    """Model for user query parameters."""
+        Raises:
+            ValueError: If the URL is not an absolute http(s) URL
+        """
+        parts = urlsplit(value)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"app_url must be an absolute http(s) URL: {value}")
+        return value.rstrip("/")
+
+
+class UserQueryModel(NamedTuple):
+    """
+    User query parameters, exactly one of id or email.
+
+    A plain tuple rather than a model: it is built once per command from
+    two CLI arguments, so pydantic would only add construction cost.
+    """
 
     id: str | None = None
-    email: EmailStr | None = None
+    email: str | None = None
+
+    @classmethod
+    def parse(cls, id: str | None = None, email: str | None = None) -> "UserQueryModel":
+        """
+        Builds a query, checking that exactly one valid lookup key is given.
+
+        Args:
+            id: The Okta user ID
+            email: The user's email address
+
+        Returns:
+            UserQueryModel: The query
+
+        Raises:
+            ValueError: If both or neither keys are given, or the email is invalid
+        """
+        if bool(id) == bool(email):
+            raise ValueError("Exactly one of id or email must be provided")
+        return cls(id, _check_email(email))
 
 
 class OktaUserType(BaseModel):
     """Okta user type reference."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
 
 
 class OktaCredentialsProvider(BaseModel):
     """Okta credentials provider information."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     type: str
     name: str
 
 
 class OktaCredentials(BaseModel):
-    """Okta user credentials."""
+    """
+    Okta user credentials.
+
+    Not nested in OktaUserResponse, which keeps only the provider's type and name.
+    """
+
+    model_config = RESPONSE_MODEL_CONFIG
 
     provider: OktaCredentialsProvider
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "OktaCredentials":
+        """
+        Builds credentials from trusted data without validation.
+
+        Args:
+            data: Credentials object as returned by the Okta API
+
+        Returns:
+            OktaCredentials: The unvalidated model
+        """
+        return cls.model_construct(
+            provider=OktaCredentialsProvider.model_construct(**data["provider"])
+        )
+
 
 class OktaUserProfile(BaseModel):
     """
@@ -43,22 +175,32 @@ class OktaUserProfile(BaseModel):
     Contains all profile fields from the Okta User API.
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     reportGroupList: Optional[str] = None
     firstName: str
     lastName: str
     mobilePhone: Optional[str] = None
     placementOrg: Optional[str] = None
     portalAccessGroup: Optional[str] = None
-    secondEmail: Optional[str] = None
-    login: EmailStr
-    email: EmailStr
-    ackNewBusiness: Optional[int] = None
+    secondEmail: Optional[OktaEmail] = None
+    login: OktaEmail
+    email: OktaEmail
+    # 0/1 flag in Okta; pydantic's bool validator maps 0/1 (and true/false) directly
+    ackNewBusiness: Optional[bool] = None
 
-    class Config:
-        """Pydantic config."""
+    @classmethod
+    def from_trusted(cls, data: dict) -> "OktaUserProfile":
+        """
+        Builds a profile from trusted data without validation.
 
-        # Allow extra fields that might come from Okta
-        extra = "allow"
+        Args:
+            data: Profile object as returned by the Okta API
+
+        Returns:
+            OktaUserProfile: The unvalidated model
+        """
+        return cls.model_construct(**data)
 
 
 class OktaUserResponse(BaseModel):
@@ -68,8 +210,10 @@ class OktaUserResponse(BaseModel):
     Based on the Okta Users API v1 schema.
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
-    status: str
+    status: OktaStatus
     created: Optional[str] = None
     activated: Optional[str] = None
     statusChanged: Optional[str] = None
@@ -78,22 +222,64 @@ class OktaUserResponse(BaseModel):
     passwordChanged: Optional[str] = None
     type: OktaUserType
     profile: OktaUserProfile
-    credentials: Optional[OktaCredentials] = None
+    # credentials.provider is flattened into two strings, read straight from the
+    # nested JSON instead of building OktaCredentials/OktaCredentialsProvider models
+    credentials_provider_type: Optional[str] = Field(
+        default=None, validation_alias=AliasPath("credentials", "provider", "type")
+    )
+    credentials_provider_name: Optional[str] = Field(
+        default=None, validation_alias=AliasPath("credentials", "provider", "name")
+    )
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "OktaUserResponse":
+        """
+        Builds a user from trusted data without validation.
+
+        model_construct skips pydantic-core entirely but does not recurse, so the
+        nested models are constructed here as well. Only use it for data that
+        already matches the schema, e.g. responses straight from Okta.
+
+        Args:
+            data: User object as returned by the Okta API
+
+        Returns:
+            OktaUserResponse: The unvalidated model
+        """
+        provider = (data.get("credentials") or {}).get("provider") or {}
+        return cls.model_construct(
+            **{
+                **data,
+                "type": OktaUserType.model_construct(**data["type"]),
+                "profile": OktaUserProfile.from_trusted(data["profile"]),
+                "credentials_provider_type": provider.get("type"),
+                "credentials_provider_name": provider.get("name"),
+            }
+        )
+
+
+# The nested profile and type must reference the models defined above, so their
+# validators are shared rather than rebuilt from a copy declared elsewhere
+assert OktaUserResponse.model_fields["profile"].annotation is OktaUserProfile
+assert OktaUserResponse.model_fields["type"].annotation is OktaUserType
 
-    class Config:
-        """Pydantic config."""
 
-        # Allow extra fields like _links that we don't use
-        extra = "allow"
+# Validates a whole page of users in one call into pydantic-core instead of one
+# per user. Built lazily like the models it wraps.
+USER_LIST_ADAPTER = TypeAdapter(list[OktaUserResponse], config=ConfigDict(defer_build=True))
 
 
 __all__ = [
     "ConfigModel",
+    "OktaEmail",
+    "OktaStatus",
     "UserQueryModel",
     "OktaUserType",
     "OktaCredentialsProvider",
     "OktaCredentials",
     "OktaUserProfile",
     "OktaUserResponse",
+    "USER_LIST_ADAPTER",
     "ValidationError",
+    "SKIP_VALIDATION",
 ]